@@ -14,9 +14,11 @@ For a complete picture of the global tariff landscape.
 """
 
 import os
+import gzip
 import json
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
@@ -112,7 +114,8 @@ def load_data():
     
     # Define paths for different data files
     tariff_data_path = os.path.join(data_dir, "tariff_data_latest.json")
-    qr_data_path = os.path.join(data_dir, "qr_data_latest.json")
+    qr_data_path = os.path.join(data_dir, "qr_data_latest.json.gz")
+    qr_parquet_path = os.path.join(data_dir, "qr_data_latest.parquet")
     census_data_path = os.path.join(data_dir, "census_data_latest.json")
     whitehouse_data_path = os.path.join(data_dir, "whitehouse_data_latest.json")
     news_data_path = os.path.join(data_dir, "news_data_latest.json")
@@ -169,10 +172,21 @@ def load_data():
         except Exception as e:
             st.error(f"Error loading BEA data: {e}")
     
-    # Load WTO QR data if available
-    if os.path.exists(qr_data_path):
+    # Load WTO QR data if available, preferring the Parquet snapshot
+    if os.path.exists(qr_parquet_path):
         try:
-            with open(qr_data_path, 'r') as f:
+            qr_table = pq.read_table(qr_parquet_path)
+            qr_df = qr_table.to_pandas()
+            # Drop categories left over from rows filtered out before saving
+            for col in qr_df.select_dtypes("category").columns:
+                qr_df[col] = qr_df[col].cat.remove_unused_categories()
+            data["qr_data"] = qr_df
+            data["qr_timestamp"] = (qr_table.schema.metadata or {}).get(b"timestamp", b"").decode() or None
+        except Exception as e:
+            st.error(f"Error loading QR data: {e}")
+    elif os.path.exists(qr_data_path):
+        try:
+            with gzip.open(qr_data_path, 'rt') as f:
                 qr_json = json.load(f)
                 if isinstance(qr_json, dict) and "data" in qr_json:
                     data["qr_data"] = pd.DataFrame(qr_json["data"])
@@ -1364,10 +1378,8 @@ with tab6:
             
             if "whitehouse_data" in data and "countries_mentioned" in data["whitehouse_data"].columns:
                 # Filter to policies mentioning this country
-                country_policies = data["whitehouse_data"].apply(
-                    lambda row: selected_country in row.get("countries_mentioned", []) 
-                    if isinstance(row.get("countries_mentioned"), list) else False, 
-                    axis=1
+                country_policies = data["whitehouse_data"]["countries_mentioned"].map(
+                    lambda countries: isinstance(countries, list) and selected_country in countries
                 )
                 
                 country_wh_data = data["whitehouse_data"][country_policies]
@@ -1403,10 +1415,8 @@ with tab6:
             
             if "news_data" in data and "countries" in data["news_data"].columns:
                 # Filter to news mentioning this country
-                country_news = data["news_data"].apply(
-                    lambda row: selected_country in row.get("countries", []) 
-                    if isinstance(row.get("countries"), list) else False, 
-                    axis=1
+                country_news = data["news_data"]["countries"].map(
+                    lambda countries: isinstance(countries, list) and selected_country in countries
                 )
                 
                 country_news_data = data["news_data"][country_news]
@@ -10,14 +10,18 @@ tariff and trade-related content with rich metadata.
 
 import os
 import re
-import json
+import time
 import logging
+import orjson
 import requests
-import pandas as pd
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from itertools import product
+from itertools import chain, product
 from bs4 import BeautifulSoup
-from textblob import TextBlob
+from textblob.en.sentiments import PatternAnalyzer
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +34,223 @@ logging.basicConfig(
 )
 logger = logging.getLogger("NewsAPI_Scraper")
 
+# Append-only article archive (one JSON document per line) plus its sidecars
+NEWS_ARCHIVE_FILENAME = "news_data.jsonl"
+NEWS_ARCHIVE_URLS_FILENAME = "news_data_urls.txt"
+NEWS_ARCHIVE_META_FILENAME = "news_data_latest_meta.json"
+
+# Keywords for countries
+COUNTRY_KEYWORDS = {
+    "United States": ["united states", "u.s.", "usa", "america"],
+    "China": ["china", "chinese"],
+    "European Union": ["european union", "eu", "europe"],
+    "Canada": ["canada", "canadian"],
+    "Mexico": ["mexico", "mexican"],
+    "Japan": ["japan", "japanese"],
+    "South Korea": ["south korea", "korean"],
+    "United Kingdom": ["uk", "britain", "british", "united kingdom"],
+    "Brazil": ["brazil", "brazilian"],
+    "India": ["india", "indian"],
+    "Australia": ["australia", "australian"],
+    "Vietnam": ["vietnam", "vietnamese"],
+    "Taiwan": ["taiwan", "taiwanese"],
+    "Russia": ["russia", "russian"],
+    "Germany": ["germany", "german"]
+}
+
+# Keywords for industries
+INDUSTRY_KEYWORDS = {
+    "Steel": ["steel", "metal", "metallurgical"],
+    "Aluminum": ["aluminum", "aluminium"],
+    "Automotive": ["automotive", "car", "vehicle", "auto"],
+    "Agriculture": ["agriculture", "farm", "crop", "food", "livestock"],
+    "Technology": ["technology", "tech", "electronics"],
+    "Energy": ["energy", "oil", "gas", "solar", "renewable"],
+    "Textiles": ["textile", "clothing", "apparel", "fabric"],
+    "Pharmaceuticals": ["pharmaceutical", "drug", "medicine"],
+    "Chemicals": ["chemical", "petrochemical"],
+    "Semiconductor": ["semiconductor", "chip", "microchip"]
+}
+
+# Keywords for tariff types
+TARIFF_TYPE_KEYWORDS = {
+    "Reciprocal": ["reciprocal", "reciprocity"],
+    "Retaliatory": ["retaliatory", "retaliation", "retaliate"],
+    "Protective": ["protective", "protection", "safeguard"],
+    "Anti-dumping": ["anti-dumping", "dumping"],
+    "Countervailing": ["countervailing", "subsidy", "subsidies"],
+    "De Minimis": ["de minimis", "minimum threshold", "duty free"],
+    "Section 301": ["section 301", "301 tariff"],
+    "Section 232": ["section 232", "232 tariff"]
+}
+
+# Keywords for actions
+ACTION_KEYWORDS = {
+    "Implementation": ["implemented", "imposed", "introduced", "announced", "enacted"],
+    "Increase": ["increased", "raised", "hiked"],
+    "Removal": ["removed", "eliminated", "dropped", "lifted"],
+    "Reduction": ["reduced", "lowered", "cut", "decreased"],
+    "Exemption": ["exempted", "exemption", "waived", "waiver"],
+    "Response": ["responded", "retaliated", "counter"]
+}
+
+# Output field for each keyword table, in the order fields are reported
+CATEGORY_KEYWORDS = {
+    "countries": COUNTRY_KEYWORDS,
+    "industries": INDUSTRY_KEYWORDS,
+    "tariff_types": TARIFF_TYPE_KEYWORDS,
+    "actions": ACTION_KEYWORDS
+}
+
+# Word tokens; boundaries match those of the \b-anchored keyword patterns
+TOKEN_RE = re.compile(r"\w+")
+
+def _build_keyword_index(category_keywords):
+    """
+    Split the keyword tables into a token lookup and a list of phrase patterns.
+    
+    Keywords that are a single word token are resolved by hashing the article's
+    tokens; phrases and dotted or hyphenated keywords keep a word-bounded regex
+    that accepts any run of whitespace between words, since text that needs
+    no HTML cleaning is not whitespace-normalized. Every word in such a keyword
+    must also appear as a whole token of the text, so each phrase carries the
+    token set it requires and its regex only runs when those tokens are present.
+    
+    Returns:
+        Tuple of (token -> tuple of (field, label) hits, frozenset of all
+        tokens used by any keyword, list of (required tokens, compiled
+        pattern, (field, label)))
+    """
+    token_hits = {}
+    phrase_patterns = []
+    for field, table in category_keywords.items():
+        for label, keywords in table.items():
+            for keyword in keywords:
+                hit = (field, label)
+                if TOKEN_RE.fullmatch(keyword):
+                    token_hits[keyword] = token_hits.get(keyword, ()) + (hit,)
+                else:
+                    required = frozenset(TOKEN_RE.findall(keyword))
+                    phrase = r'\s+'.join(re.escape(word) for word in keyword.split())
+                    phrase_patterns.append((required, re.compile(r'\b' + phrase + r'\b'), hit))
+    keyword_tokens = frozenset(token_hits).union(*(required for required, _, _ in phrase_patterns))
+    return token_hits, keyword_tokens, phrase_patterns
+
+_TOKEN_HITS, _KEYWORD_TOKENS, _PHRASE_PATTERNS = _build_keyword_index(CATEGORY_KEYWORDS)
+
+def match_keyword_categories(full_text):
+    """
+    Match lower-cased article text against all category keyword tables at once.
+    
+    Args:
+        full_text: Lower-cased article text
+        
+    Returns:
+        Dictionary mapping each category field to the matched labels, in
+        keyword-table order
+    """
+    tokens = _KEYWORD_TOKENS.intersection(TOKEN_RE.findall(full_text))
+    found = set()
+    for token in tokens:
+        found.update(_TOKEN_HITS.get(token, ()))
+    for required, pattern, hit in _PHRASE_PATTERNS:
+        if hit not in found and required <= tokens and pattern.search(full_text):
+            found.add(hit)
+    return {
+        field: [label for label in table if (field, label) in found]
+        for field, table in CATEGORY_KEYWORDS.items()
+    }
+
+# Tariff rates such as "25%", "10 percent duty" or "tariff of 5%", in one pass
+RATE_RE = re.compile(r'(?:tariff\s*of\s*)?(\d+(?:\.\d+)?)\s*(?:%|percent)(?:\s+(?:tariff|duty))?')
+
+# Implementation dates such as "March 5, 2025"
+DATE_RE = re.compile(
+    r'(January|February|March|April|May|June|July|August|September|October|November|December)'
+    r'\s+\d{1,2}(?:st|nd|rd|th)?,\s+\d{4}'
+)
+
+# Below this many articles a process pool costs more than it saves
+PARALLEL_CATEGORIZATION_THRESHOLD = 200
+
+NEWSAPI_URL = "https://newsapi.org/v2/everything"
+
+# (connect, read) timeouts: fail fast on dead connections so they can be retried
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Longest we are willing to sleep when NewsAPI asks us to back off
+MAX_RATE_LIMIT_WAIT = 60
+
+class RateLimitError(requests.RequestException):
+    """Raised when NewsAPI answers 429 so the request is retried after backing off."""
+
+def create_session():
+    """Create a persistent session that keeps NewsAPI connections alive between queries."""
+    session = requests.Session()
+    # Connection errors, timeouts and 429s are retried with backoff in _get_newsapi
+    retry_strategy = Retry(
+        total=3,
+        connect=0,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET"]
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=retry_strategy)
+    session.mount("https://", adapter)
+    return session
+
+# Shared session so every query reuses the same TCP+TLS connection pool
+_SESSION = create_session()
+
+# TextBlob's default sentiment analyzer, created once and called directly so
+# each article skips TextBlob construction and its unused tokenizer/tagger
+_SENTIMENT_ANALYZER = PatternAnalyzer()
+
+def _rate_limit_delay(response):
+    """
+    Work out how long NewsAPI wants us to wait from a 429 response.
+    
+    Honors ``Retry-After`` (seconds) and ``X-RateLimit-Reset`` (epoch seconds
+    or seconds remaining), capped at MAX_RATE_LIMIT_WAIT.
+    """
+    for header in ("Retry-After", "X-RateLimit-Reset"):
+        value = response.headers.get(header)
+        if not value:
+            continue
+        try:
+            delay = float(value)
+        except ValueError:
+            continue
+        if delay > time.time():
+            delay -= time.time()
+        return min(max(delay, 0), MAX_RATE_LIMIT_WAIT)
+    return 1
+
+# Jittered exponential backoff for timeouts and connection errors
+_TRANSIENT_ERROR_WAIT = wait_random_exponential(multiplier=0.5, max=10)
+
+def _retry_wait(retry_state):
+    """Tenacity wait: as long as NewsAPI asked for after a 429, otherwise jittered backoff."""
+    error = retry_state.outcome.exception()
+    if isinstance(error, RateLimitError):
+        return _rate_limit_delay(error.response)
+    return _TRANSIENT_ERROR_WAIT(retry_state)
+
+@retry(
+    stop=stop_after_attempt(4),
+    wait=_retry_wait,
+    retry=retry_if_exception_type((requests.Timeout, requests.ConnectionError, RateLimitError)),
+    reraise=True
+)
+def _get_newsapi(params):
+    """GET the NewsAPI endpoint, retrying transient failures and 429s after the wait chosen by _retry_wait."""
+    response = _SESSION.get(NEWSAPI_URL, params=params, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 429:
+        logger.warning(f"NewsAPI rate limit hit for query '{params.get('q')}'. Server asks for a {_rate_limit_delay(response):.1f} second wait.")
+        raise RateLimitError(f"Rate limit exceeded for query: {params.get('q')}", response=response)
+    return response
+
 def fetch_articles_for_query(api_key, query, language="en", sort_by="publishedAt", page_size=25, page=1):
     """
     Fetch articles using a specific query string.
@@ -46,7 +267,6 @@ def fetch_articles_for_query(api_key, query, language="en", sort_by="publishedAt
     Returns:
         List of article dictionaries
     """
-    url = "https://newsapi.org/v2/everything"
     params = {
         "q": query,
         "language": language,
@@ -56,7 +276,7 @@ def fetch_articles_for_query(api_key, query, language="en", sort_by="publishedAt
         "apiKey": api_key
     }
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = _get_newsapi(params)
         if response.status_code == 200:
             data = response.json()
             articles = data.get("articles", [])
@@ -149,11 +369,8 @@ def analyze_sentiment(text):
         and score (-1.0 to 1.0)
     """
     try:
-        # Use TextBlob for sentiment analysis
-        blob = TextBlob(text)
-        
-        # Get polarity score (-1 to 1)
-        polarity = blob.sentiment.polarity
+        # Get polarity score (-1 to 1) from TextBlob's pattern analyzer
+        polarity = _SENTIMENT_ANALYZER.analyze(text).polarity
         
         # Classify sentiment
         if polarity > 0.1:
@@ -171,151 +388,50 @@ def analyze_sentiment(text):
         logger.warning(f"Error during sentiment analysis: {e}")
         return {"classification": "neutral", "score": 0.0}
 
-def categorize_tariff_articles(articles):
+def iter_categorized_articles(articles):
     """
-    Categorize articles related to tariffs by country, industry, tariff type, and action.
+    Categorize articles related to tariffs by country, industry, tariff type, and action,
+    yielding each categorized article as soon as it is ready.
     Detailed logging is added so you can trace step-by-step how fields are extracted.
     
     Args:
-        articles: List of article dictionaries
+        articles: Iterable of article dictionaries
         
-    Returns:
-        List of articles with additional categorization metadata
+    Yields:
+        Article dictionaries with additional categorization metadata
     """
-    # Define keywords for countries.
-    countries = {
-        "United States": ["united states", "u.s.", "usa", "america"],
-        "China": ["china", "chinese"],
-        "European Union": ["european union", "eu", "europe"],
-        "Canada": ["canada", "canadian"],
-        "Mexico": ["mexico", "mexican"],
-        "Japan": ["japan", "japanese"],
-        "South Korea": ["south korea", "korean"],
-        "United Kingdom": ["uk", "britain", "british", "united kingdom"],
-        "Brazil": ["brazil", "brazilian"],
-        "India": ["india", "indian"],
-        "Australia": ["australia", "australian"],
-        "Vietnam": ["vietnam", "vietnamese"],
-        "Taiwan": ["taiwan", "taiwanese"],
-        "Russia": ["russia", "russian"],
-        "Germany": ["germany", "german"]
-    }
-    
-    # Define keywords for industries.
-    industries = {
-        "Steel": ["steel", "metal", "metallurgical"],
-        "Aluminum": ["aluminum", "aluminium"],
-        "Automotive": ["automotive", "car", "vehicle", "auto"],
-        "Agriculture": ["agriculture", "farm", "crop", "food", "livestock"],
-        "Technology": ["technology", "tech", "electronics"],
-        "Energy": ["energy", "oil", "gas", "solar", "renewable"],
-        "Textiles": ["textile", "clothing", "apparel", "fabric"],
-        "Pharmaceuticals": ["pharmaceutical", "drug", "medicine"],
-        "Chemicals": ["chemical", "petrochemical"],
-        "Semiconductor": ["semiconductor", "chip", "microchip"]
-    }
-    
-    # Define keywords for tariff types.
-    tariff_types = {
-        "Reciprocal": ["reciprocal", "reciprocity"],
-        "Retaliatory": ["retaliatory", "retaliation", "retaliate"],
-        "Protective": ["protective", "protection", "safeguard"],
-        "Anti-dumping": ["anti-dumping", "dumping"],
-        "Countervailing": ["countervailing", "subsidy", "subsidies"],
-        "De Minimis": ["de minimis", "minimum threshold", "duty free"],
-        "Section 301": ["section 301", "301 tariff"],
-        "Section 232": ["section 232", "232 tariff"]
-    }
-    
-    # Define keywords for actions.
-    actions = {
-        "Implementation": ["implemented", "imposed", "introduced", "announced", "enacted"],
-        "Increase": ["increased", "raised", "hiked"],
-        "Removal": ["removed", "eliminated", "dropped", "lifted"],
-        "Reduction": ["reduced", "lowered", "cut", "decreased"],
-        "Exemption": ["exempted", "exemption", "waived", "waiver"],
-        "Response": ["responded", "retaliated", "counter"]
-    }
-    
-    categorized = []
     for article in articles:
         # Ensure that title, description, and content are strings (fallback to empty string)
         title = str(article.get("title") or "")
         description = str(article.get("description") or "")
         content = str(article.get("content") or "")
         
-        # Clean HTML from content if present
-        content = clean_html_content(content)
+        # Clean HTML from content only when it contains markup
+        if "<" in content:
+            content = clean_html_content(content)
         
-        # Combine text for analysis
-        full_text = " ".join([title, description, content]).lower()
+        # Combine and lower-case the text once; every scan below reuses it
+        full_text = f"{title} {description} {content}".lower()
         
         logger.debug(f"Processing article: {title[:60]}...")
         
-        # Extract countries
-        article_countries = []
-        for country, keys in countries.items():
-            for keyword in keys:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', full_text):
-                    if country not in article_countries:
-                        article_countries.append(country)
-                        logger.debug(f"Found country '{country}' for article.")
-                    break
-        
-        # Extract industries
-        article_industries = []
-        for industry, keys in industries.items():
-            for keyword in keys:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', full_text):
-                    if industry not in article_industries:
-                        article_industries.append(industry)
-                        logger.debug(f"Found industry '{industry}' for article.")
-                    break
-        
-        # Extract tariff types
-        article_tariff_types = []
-        for t_type, keys in tariff_types.items():
-            for keyword in keys:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', full_text):
-                    if t_type not in article_tariff_types:
-                        article_tariff_types.append(t_type)
-                        logger.debug(f"Found tariff type '{t_type}' for article.")
-                    break
-        
-        # Extract actions
-        article_actions = []
-        for action, keys in actions.items():
-            for keyword in keys:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', full_text):
-                    if action not in article_actions:
-                        article_actions.append(action)
-                        logger.debug(f"Found action '{action}' for article.")
-                    break
+        # Extract countries, industries, tariff types and actions
+        categories = match_keyword_categories(full_text)
+        article_countries = categories["countries"]
+        article_industries = categories["industries"]
+        article_tariff_types = categories["tariff_types"]
+        article_actions = categories["actions"]
+        logger.debug(f"Found categories {categories} for article.")
         
-        # Extract tariff rates using regex patterns
-        rate_patterns = [
-            r'(\d+(?:\.\d+)?)\s*percent(?:\s+tariff|\s+duty)?',
-            r'(\d+(?:\.\d+)?)\s*%(?:\s+tariff|\s+duty)?',
-            r'tariff\s*of\s*(\d+(?:\.\d+)?)\s*%',
-            r'(\d+(?:\.\d+)?)\s*%\s*duty'
-        ]
-        tariff_rates = []
-        for pattern in rate_patterns:
-            found_rates = re.findall(pattern, full_text)
-            if found_rates:
-                logger.debug(f"Pattern '{pattern}' found rates: {found_rates}")
-            tariff_rates.extend(found_rates)
+        # Extract tariff rates; each rate mention is reported once
+        tariff_rates = [m.group(1) for m in RATE_RE.finditer(full_text)]
+        if tariff_rates:
+            logger.debug(f"Found rates: {tariff_rates}")
         
-        # Extract implementation dates using regex
-        date_patterns = [
-            r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?,\s+\d{4}'
-        ]
-        implementation_dates = []
-        for pattern in date_patterns:
-            found_dates = re.findall(pattern, full_text)
-            if found_dates:
-                logger.debug(f"Pattern '{pattern}' found dates: {found_dates}")
-            implementation_dates.extend(found_dates)
+        # Extract implementation dates
+        implementation_dates = [m.group(1) for m in DATE_RE.finditer(full_text)]
+        if implementation_dates:
+            logger.debug(f"Found dates: {implementation_dates}")
         
         # Analyze sentiment
         sentiment_data = analyze_sentiment(title + " " + description)
@@ -336,18 +452,82 @@ def categorize_tariff_articles(articles):
             "sentiment": sentiment_data
         }
         
-        categorized.append(categorized_article)
+        yield categorized_article
+
+def categorize_tariff_articles(articles):
+    """
+    Categorize articles related to tariffs by country, industry, tariff type, and action.
     
+    Args:
+        articles: List of article dictionaries
+        
+    Returns:
+        List of articles with additional categorization metadata
+    """
+    categorized = list(iter_categorized_articles(articles))
     logger.info(f"Categorized {len(categorized)} articles with tariff information.")
     return categorized
 
+def categorize_tariff_articles_parallel(articles, max_workers=None):
+    """
+    Categorize articles across a pool of worker processes.
+    
+    Categorization is CPU-bound (regex scans and sentiment analysis), so the
+    articles are split into one contiguous chunk per worker and each chunk is
+    run through categorize_tariff_articles in its own process. Results are
+    yielded chunk by chunk in input order, so they can be written out while
+    later chunks are still being categorized. Small batches are categorized
+    in-process.
+    
+    Args:
+        articles: List of article dictionaries
+        max_workers: Number of worker processes (default: CPU count)
+        
+    Yields:
+        Article dictionaries with additional categorization metadata
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers < 2 or len(articles) < PARALLEL_CATEGORIZATION_THRESHOLD:
+        yield from iter_categorized_articles(articles)
+        return
+    
+    chunk_size = -(-len(articles) // workers)
+    chunks = [articles[i:i + chunk_size] for i in range(0, len(articles), chunk_size)]
+    
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        yield from chain.from_iterable(executor.map(categorize_tariff_articles, chunks))
+
+def load_archived_urls(output_dir="data"):
+    """
+    Load the set of article URLs already present in the JSONL archive.
+    
+    Args:
+        output_dir: Directory holding the archive sidecar
+        
+    Returns:
+        Set of archived article URLs
+    """
+    urls_filename = os.path.join(output_dir, NEWS_ARCHIVE_URLS_FILENAME)
+    if not os.path.exists(urls_filename):
+        return set()
+    with open(urls_filename, 'r', encoding="utf-8") as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
 def save_articles_to_json(data, output_dir="data"):
     """
-    Saves the categorized articles to a JSON file, including a latest version
-    for the dashboard to access.
+    Streams categorized articles to the latest JSON file for the dashboard and
+    appends newly seen ones to the JSON-Lines archive.
+    
+    Articles are consumed one at a time, so ``data`` may be a generator and
+    peak memory stays at a single article. Each article is serialized once
+    and the same bytes go to both files. The latest file is replaced
+    atomically once fully written. Only articles whose URL is not yet
+    archived are appended to the archive, so each run writes O(new articles)
+    there. A small metadata file records the run timestamp and counts. The
+    archive can be read back with ``pd.read_json(path, lines=True)``.
     
     Args:
-        data: List of categorized article dictionaries
+        data: Iterable of categorized article dictionaries
         output_dir: Directory to save the data files
         
     Returns:
@@ -356,26 +536,50 @@ def save_articles_to_json(data, output_dir="data"):
     # Ensure output directory exists
     os.makedirs(output_dir, exist_ok=True)
     
-    # Create timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_timestamp = datetime.now().isoformat()
     
-    # Prepare data with timestamp
-    output_data = {
-        "timestamp": datetime.now().isoformat(),
-        "data": data
-    }
-    
-    # Save timestamped version
-    timestamped_filename = os.path.join(output_dir, f"news_data_{timestamp}.json")
-    with open(timestamped_filename, 'w', encoding="utf-8") as f:
-        json.dump(output_data, f, indent=4, ensure_ascii=False)
-    
-    # Save latest version for dashboard
+    archived_urls = load_archived_urls(output_dir)
     latest_filename = os.path.join(output_dir, "news_data_latest.json")
-    with open(latest_filename, 'w', encoding="utf-8") as f:
-        json.dump(output_data, f, indent=4, ensure_ascii=False)
+    archive_filename = os.path.join(output_dir, NEWS_ARCHIVE_FILENAME)
+    urls_filename = os.path.join(output_dir, NEWS_ARCHIVE_URLS_FILENAME)
+    count = 0
+    new_count = 0
+    # Stream into a temporary file and swap it in, so the dashboard never
+    # reads a half-written latest file
+    tmp_filename = latest_filename + ".tmp"
+    with open(tmp_filename, 'wb', buffering=1 << 20) as latest, \
+            open(archive_filename, 'ab') as archive, \
+            open(urls_filename, 'a', encoding="utf-8") as urls:
+        latest.write(b'{"timestamp":' + orjson.dumps(run_timestamp) + b',"data":[')
+        for article in data:
+            payload = orjson.dumps(article)
+            if count:
+                latest.write(b',')
+            latest.write(payload)
+            count += 1
+            
+            # Append unseen articles to the archive, deduplicating by URL
+            url = article.get("url")
+            if url and url in archived_urls:
+                continue
+            archive.write(payload + b"\n")
+            if url:
+                urls.write(url + "\n")
+                archived_urls.add(url)
+            new_count += 1
+        latest.write(b']}')
+    os.replace(tmp_filename, latest_filename)
     
-    logger.info(f"Articles successfully saved to {timestamped_filename} and {latest_filename}")
+    meta_filename = os.path.join(output_dir, NEWS_ARCHIVE_META_FILENAME)
+    with open(meta_filename, 'wb') as f:
+        f.write(orjson.dumps({
+            "timestamp": run_timestamp,
+            "count": count,
+            "new_count": new_count,
+            "archived_urls": len(archived_urls)
+        }))
+    
+    logger.info(f"Saved {count} articles to {latest_filename} and appended {new_count} new articles to {archive_filename}")
     return latest_filename
 
 def run_news_scraper(max_articles_per_combo=10):
@@ -421,13 +625,11 @@ def run_news_scraper(max_articles_per_combo=10):
         max_articles_per_combo
     )
     
-    # Categorize articles
-    categorized_articles = categorize_tariff_articles(articles)
-    
-    # Save articles
+    # Categorize articles and stream them to disk as they are produced
+    categorized_articles = categorize_tariff_articles_parallel(articles)
     latest_file = save_articles_to_json(categorized_articles)
     
-    logger.info(f"NewsAPI scraping completed. Found {len(categorized_articles)} tariff-related articles.")
+    logger.info(f"NewsAPI scraping completed. Processed {len(articles)} tariff-related articles.")
     return latest_file
 
 if __name__ == "__main__":
@@ -7,19 +7,23 @@ This module provides an enhanced scraper for White House presidential actions,
 with specific focus on identifying and extracting tariff and trade-related content.
 """
 
+import io
 import os
 import time
 import random
 import logging
-import json
 import re
+import threading
+import orjson
 import requests
-import pandas as pd
-from bs4 import BeautifulSoup
+from openpyxl import Workbook
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
-from datetime import datetime
+from requests_cache import CachedSession
+from datetime import datetime, timedelta
 
 # Configure logging
 logging.basicConfig(
@@ -36,7 +40,14 @@ logging.basicConfig(
 # ------------------------------
 BASE_URL = "https://www.whitehouse.gov/presidential-actions/"
 MAX_PAGES = 10 
-REQUEST_DELAY = 1.5  # Slightly increased delay to be more respectful
+MAX_REQUESTS_PER_SECOND = 4  # Shared across all fetch threads to stay respectful
+MAX_CONCURRENT_FETCHES = 8  # Full-text pages fetched in parallel
+MAX_PAGE_BYTES = 5_000_000  # Pages larger than this are skipped rather than held in memory
+HTTP_CACHE_NAME = "wh_cache"  # SQLite file holding cached responses
+POST_CACHE_EXPIRY = timedelta(days=7)  # Published posts rarely change
+LISTING_CACHE_EXPIRY = timedelta(hours=1)
+# Classes WordPress puts on the "Next" pagination link
+NEXT_LINK_SELECTOR = "nav.pagination a.next, a.next.page-numbers, a.wp-block-query-pagination-next"
 
 # Keywords to identify tariff and trade-related content
 TARIFF_KEYWORDS = [
@@ -45,6 +56,39 @@ TARIFF_KEYWORDS = [
     'trade agreement', 'trade policy', 'nafta', 'usmca', 'trade representative'
 ]
 
+# Keywords worth scanning for: any keyword containing another one (e.g. 'trade act'
+# contains 'trade') can never match on its own, so it is dropped up front
+TARIFF_GATE_KEYWORDS = tuple(
+    k for k in TARIFF_KEYWORDS
+    if not any(other != k and other in k for other in TARIFF_KEYWORDS)
+)
+
+# Countries looked for in tariff-related posts
+COMMON_COUNTRIES = [
+    "China", "Mexico", "Canada", "Japan", "Germany", "South Korea",
+    "United Kingdom", "Vietnam", "Taiwan", "India", "Russia", "Brazil",
+    "France", "Italy", "Australia", "Argentina", "Israel"
+]
+
+# Whole-word country mentions, so e.g. "Indiana" does not count as India
+COUNTRY_RE = re.compile(r"\b(" + "|".join(map(re.escape, COMMON_COUNTRIES)) + r")\b")
+
+# Tariff rate mentions, one alternation so the text is scanned once
+TARIFF_RATE_RE = re.compile(
+    r'(?P<pre>\d+(?:\.\d+)?)\s*%\s*(?:tariff|duty|tax)'  # e.g., "25% tariff"
+    r'|tariff\s*(?:of|at)?\s*(?P<mid>\d+(?:\.\d+)?)\s*%'  # e.g., "tariff of 25%"
+    r'|(?P<pct>\d+(?:\.\d+)?)\s*percent\s*(?:tariff|duty|tax)',  # e.g., "25 percent tariff"
+    re.IGNORECASE
+)
+
+# Effective date phrasings, in order of preference
+EFFECTIVE_DATE_PATTERNS = [
+    re.compile(r'effective(?:\s+\w+){0,3}\s+(\w+\s+\d{1,2},?\s+\d{4})', re.IGNORECASE),  # effective on January 1, 2025
+    re.compile(r'take(?:\s+\w+){0,2}\s+effect(?:\s+\w+){0,3}\s+(\w+\s+\d{1,2},?\s+\d{4})', re.IGNORECASE),  # takes effect on January 1, 2025
+    re.compile(r'beginning(?:\s+\w+){0,2}\s+(\w+\s+\d{1,2},?\s+\d{4})', re.IGNORECASE),  # beginning on January 1, 2025
+    re.compile(r'implement(?:\s+\w+){0,3}\s+(\w+\s+\d{1,2},?\s+\d{4})', re.IGNORECASE)  # implemented on January 1, 2025
+]
+
 # User agents for request rotation
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -58,68 +102,159 @@ USER_AGENTS = [
     "(KHTML, like Gecko) Version/13.1.2 Mobile/15E148 Safari/604.1"
 ]
 
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` requests per second, with bursts of up to `burst`."""
+    
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Going negative reserves a future token, so callers sleep outside the lock
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a token from a shared RateLimiter before each request goes out."""
+    
+    def __init__(self, limiter, *args, **kwargs):
+        self.limiter = limiter
+        super().__init__(*args, **kwargs)
+    
+    def send(self, request, **kwargs):
+        self.limiter.acquire()
+        return super().send(request, **kwargs)
+
+def is_cacheable(response):
+    """
+    Cache filter: only keep responses whose Content-Length is declared and within MAX_PAGE_BYTES.
+    The cache reads the whole body before fetch_page can stream it, so responses of
+    unknown or oversized length are left uncached and fetch_page's streaming cap applies.
+    """
+    content_length = response.headers.get("Content-Length")
+    return bool(content_length and content_length.isdigit() and int(content_length) <= MAX_PAGE_BYTES)
+
 def create_session():
-    """Create a persistent session with a retry strategy for robustness."""
-    session = requests.Session()
+    """
+    Create a persistent session with a retry strategy for robustness.
+    Responses are cached on disk per URL, so posts fetched on an earlier run are not downloaded again.
+    """
+    session = CachedSession(
+        HTTP_CACHE_NAME,
+        backend="sqlite",
+        expire_after=POST_CACHE_EXPIRY,
+        allowable_methods=("GET",),
+        cache_control=True,
+        filter_fn=is_cacheable
+    )
     retry_strategy = Retry(
         total=5,
         backoff_factor=0.3,
         status_forcelist=[500, 502, 503, 504],
         allowed_methods=["HEAD", "GET", "OPTIONS"]
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    # Pool sized to cover every concurrent full-text fetch. The limiter sits in the
+    # adapter, so responses served from the cache are not rate limited
+    adapter = RateLimitedAdapter(
+        RateLimiter(MAX_REQUESTS_PER_SECOND),
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=retry_strategy
+    )
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
 
+_SESSION = None
+
+def get_session():
+    """Return the module-wide session, creating it on first use so connections stay alive across runs."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = create_session()
+    return _SESSION
+
 def get_random_headers():
     """Generate dynamic headers with a random user agent."""
     headers = {
         "User-Agent": random.choice(USER_AGENTS),
         "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate"
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive"
     }
     logging.debug(f"Generated headers: {headers}")
     return headers
 
-def fetch_page(url, session):
-    """Fetch page content with retries, error handling, and logging."""
+def fetch_page(url, session, expire_after=None):
+    """
+    Fetch page content with retries, error handling, and logging.
+    The body is streamed in chunks and abandoned once it exceeds MAX_PAGE_BYTES.
+    expire_after overrides the session's cache lifetime for this URL.
+    """
     headers = get_random_headers()
+    request_kwargs = {}
+    if expire_after is not None:
+        request_kwargs["expire_after"] = expire_after
     try:
         logging.info(f"Fetching URL: {url}")
-        response = session.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        logging.info(f"Success: {url} responded with {response.status_code}")
-        return response.content
+        with session.get(url, headers=headers, timeout=10, stream=True, **request_kwargs) as response:
+            response.raise_for_status()
+            content_length = response.headers.get("Content-Length")
+            if content_length and content_length.isdigit() and int(content_length) > MAX_PAGE_BYTES:
+                logging.error(f"Skipping {url}: body of {content_length} bytes exceeds {MAX_PAGE_BYTES}")
+                return None
+            
+            buffer = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=65536):
+                buffer.write(chunk)
+                if buffer.tell() > MAX_PAGE_BYTES:
+                    logging.error(f"Skipping {url}: body exceeds {MAX_PAGE_BYTES} bytes")
+                    return None
+            logging.info(f"Success: {url} responded with {response.status_code}")
+        return buffer.getvalue()
     except requests.RequestException as e:
         logging.error(f"Error fetching {url}: {e}")
         return None
 
-def parse_post_list(content, base_url):
+def parse_listing(content):
+    """Parse a listing page once; the tree is shared by parse_post_list and find_next_page."""
+    return LexborHTMLParser(content)
+
+def parse_post_list(tree, base_url):
     """
-    Parse the listing page to extract post details:
+    Parse the listing page tree to extract post details:
       - Title
       - URL (link to full content)
       - Publication date
       - Categories (as comma-separated string)
     """
-    soup = BeautifulSoup(content, "html.parser")
     posts = []
 
-    for li in soup.find_all("li", class_="wp-block-post"):
+    for li in tree.css("li.wp-block-post"):
         try:
-            title_tag = li.find("h2", class_="wp-block-post-title")
-            a_tag = title_tag.find("a") if title_tag else None
-            title = a_tag.get_text(strip=True) if a_tag else "No Title"
-            url = urljoin(base_url, a_tag["href"]) if a_tag and a_tag.has_attr("href") else None
-            time_tag = li.find("time")
-            pub_date = time_tag["datetime"] if time_tag and time_tag.has_attr("datetime") else "Unknown Date"
+            title_tag = li.css_first("h2.wp-block-post-title")
+            a_tag = title_tag.css_first("a") if title_tag else None
+            title = a_tag.text(strip=True) if a_tag else "No Title"
+            href = a_tag.attributes.get("href") if a_tag else None
+            url = urljoin(base_url, href) if href else None
+            time_tag = li.css_first("time")
+            pub_date = (time_tag.attributes.get("datetime") if time_tag else None) or "Unknown Date"
             
             categories = []
-            cat_div = li.find("div", class_="taxonomy-category")
+            cat_div = li.css_first("div.taxonomy-category")
             if cat_div:
-                for cat in cat_div.find_all("a"):
-                    categories.append(cat.get_text(strip=True))
+                for cat in cat_div.css("a"):
+                    categories.append(cat.text(strip=True))
             
             post_data = {
                 "title": title,
@@ -135,6 +270,15 @@ def parse_post_list(content, base_url):
     logging.info(f"Parsed {len(posts)} posts from the current page.")
     return posts
 
+def _joined_text(node, separator=" "):
+    """Join the node's non-empty text fragments, each stripped, with separator."""
+    fragments = (
+        child.text_content.strip()
+        for child in node.traverse(include_text=True)
+        if child.tag == "-text"
+    )
+    return separator.join(fragment for fragment in fragments if fragment)
+
 def scrape_full_text(post_url, session):
     """
     Scrape the full text content from an individual post page.
@@ -145,53 +289,84 @@ def scrape_full_text(post_url, session):
     if not content:
         return ""
     
-    soup = BeautifulSoup(content, "html.parser")
+    tree = LexborHTMLParser(content)
+    tree.strip_tags(["script", "style", "template"])
     
     # Try primary selector
-    entry_div = soup.find("div", class_="entry-content")
-    if entry_div:
-        paragraphs = entry_div.find_all("p")
-        full_text = "\n\n".join(p.get_text(strip=True) for p in paragraphs)
+    entry_div = tree.css_first("div.entry-content")
+    if entry_div is not None:
+        paragraphs = entry_div.css("p")
+        full_text = "\n\n".join(p.text(strip=True) for p in paragraphs)
         logging.info(f"Scraped full text from {post_url} using 'entry-content' (length: {len(full_text)} characters)")
         return full_text
 
     # Fallback selector
-    group_div = soup.find("div", class_="wp-block-group")
-    if group_div:
-        full_text = group_div.get_text(separator=" ", strip=True)
+    group_div = tree.css_first("div.wp-block-group")
+    if group_div is not None:
+        full_text = _joined_text(group_div)
         logging.info(f"Scraped full text from {post_url} using 'wp-block-group' (length: {len(full_text)} characters)")
         return full_text
 
     # Second fallback: try to get any content
-    main_content = soup.find("main")
-    if main_content:
-        full_text = main_content.get_text(separator=" ", strip=True)
+    main_content = tree.css_first("main")
+    if main_content is not None:
+        full_text = _joined_text(main_content)
         logging.info(f"Scraped full text from {post_url} using 'main' (length: {len(full_text)} characters)")
         return full_text
 
     logging.warning(f"No content container found for {post_url}")
     return ""
 
-def find_next_page(content, current_url):
+def scrape_full_texts(posts, session):
     """
-    Discover the next page URL from pagination links.
-    Checks first for navigation inside a <nav> with class 'pagination',
-    then looks for any <a> with "Next" in its text.
+    Populate "full_text" on every post of a listing page.
+    
+    The pages are I/O bound, so they are fetched concurrently on a thread pool
+    sharing the session, with at most MAX_CONCURRENT_FETCHES requests in flight.
+    The session's rate limiter paces the requests across all threads.
+    Posts without a URL get an empty full text. The lower-cased full text is
+    cached on each post as "_full_text_lower" for keyword matching.
+    
+    Args:
+        posts: List of post dictionaries from parse_post_list
+        session: Requests session used for fetching
     """
-    soup = BeautifulSoup(content, "html.parser")
-    next_link = None
+    for post in posts:
+        if not post["url"]:
+            post["full_text"] = ""
+            post["_full_text_lower"] = ""
     
-    # Try to find pagination navigation
-    pagination = soup.find("nav", class_="pagination")
-    if pagination:
-        a_next = pagination.find("a", string=lambda s: s and "Next" in s)
-        if a_next and a_next.has_attr("href"):
-            next_link = urljoin(current_url, a_next["href"])
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+        futures = {
+            executor.submit(scrape_full_text, post["url"], session): post
+            for post in posts if post["url"]
+        }
+        for future in as_completed(futures):
+            post = futures[future]
+            post["full_text"] = future.result()
+            post["_full_text_lower"] = post["full_text"].lower()
+
+def find_next_page(tree, current_url):
+    """
+    Discover the next page URL from pagination links in the listing page tree.
+    Checks first for WordPress's next-link classes, then for navigation inside
+    a <nav> with class 'pagination', then for any <a> with "Next" in its text.
+    """
+    next_link = None
+    # WordPress marks the next link with a class, so one selector usually finds it
+    a_tag = tree.css_first(NEXT_LINK_SELECTOR)
+    href = a_tag.attributes.get("href") if a_tag is not None else None
+    if href:
+        next_link = urljoin(current_url, href)
     else:
-        # Fallback: look for any "Next" link
-        a_next = soup.find("a", string=lambda s: s and "Next" in s)
-        if a_next and a_next.has_attr("href"):
-            next_link = urljoin(current_url, a_next["href"])
+        # Try to find pagination navigation, otherwise fall back to any "Next" link
+        pagination = tree.css_first("nav.pagination")
+        scope = pagination if pagination is not None else tree
+        for a_tag in scope.css("a"):
+            href = a_tag.attributes.get("href")
+            if href and "Next" in a_tag.text():
+                next_link = urljoin(current_url, href)
+                break
     
     if next_link:
         logging.info(f"Found next page: {next_link}")
@@ -200,6 +375,13 @@ def find_next_page(content, current_url):
     
     return next_link
 
+def get_lower_full_text(post):
+    """Return the post's lower-cased full text, computing it once and caching it on the post."""
+    full_text_lower = post.get("_full_text_lower")
+    if full_text_lower is None:
+        full_text_lower = post["_full_text_lower"] = post.get("full_text", "").lower()
+    return full_text_lower
+
 def is_tariff_related(post):
     """
     Determine if a post is related to tariffs or trade based on keywords
@@ -211,15 +393,17 @@ def is_tariff_related(post):
     Returns:
         Boolean indicating if the post is tariff/trade related
     """
-    # Convert title and full text to lowercase for case-insensitive matching
+    # Check the short title against every keyword first; the full text is
+    # only lower-cased and scanned when the title has no match
     title = post.get("title", "").lower()
-    full_text = post.get("full_text", "").lower()
+    keyword = next((k for k in TARIFF_GATE_KEYWORDS if k in title), None)
+    if keyword is None:
+        full_text = get_lower_full_text(post)
+        keyword = next((k for k in TARIFF_GATE_KEYWORDS if k in full_text), None)
     
-    # Check if any keyword appears in the title or full text
-    for keyword in TARIFF_KEYWORDS:
-        if keyword in title or keyword in full_text:
-            logging.info(f"Post identified as tariff-related: '{post['title']}' (keyword: {keyword})")
-            return True
+    if keyword is not None:
+        logging.info(f"Post identified as tariff-related: '{post['title']}' (keyword: {keyword})")
+        return True
     
     return False
 
@@ -249,55 +433,45 @@ def extract_tariff_data(post):
     
     # Extract countries mentioned
     # This is a simple approach - in production, you'd use a more sophisticated NER
-    common_countries = [
-        "China", "Mexico", "Canada", "Japan", "Germany", "South Korea",
-        "United Kingdom", "Vietnam", "Taiwan", "India", "Russia", "Brazil",
-        "France", "Italy", "Australia", "Argentina", "Israel"
-    ]
-    
-    for country in common_countries:
-        if country in title or country in full_text:
-            tariff_data["countries_mentioned"].append(country)
+    found_countries = set(COUNTRY_RE.findall(title))
+    found_countries.update(COUNTRY_RE.findall(full_text))
+    tariff_data["countries_mentioned"] = [c for c in COMMON_COUNTRIES if c in found_countries]
     
     # Extract tariff rates
-    # Look for patterns like X% tariff, X percent tariff
-    tariff_patterns = [
-        r'(\d+(?:\.\d+)?)(?:\s*)?%(?:\s*)?(?:tariff|duty|tax)',  # e.g., "25% tariff"
-        r'tariff(?:\s*)?(?:of|at)?(?:\s*)?(\d+(?:\.\d+)?)(?:\s*)?%',  # e.g., "tariff of 25%"
-        r'(\d+(?:\.\d+)?)(?:\s*)?percent(?:\s*)?(?:tariff|duty|tax)',  # e.g., "25 percent tariff"
-    ]
-    
-    for pattern in tariff_patterns:
-        matches = re.finditer(pattern, full_text, re.IGNORECASE)
-        for match in matches:
-            rate = match.group(1)
-            tariff_data["tariff_rates"].append(float(rate))
-            
-            # Extract a relevant excerpt around the tariff rate mention
-            start = max(0, match.start() - 150)
-            end = min(len(full_text), match.end() + 150)
-            excerpt = full_text[start:end].strip()
-            if excerpt:
-                tariff_data["relevant_excerpt"] = excerpt
+    for match in TARIFF_RATE_RE.finditer(full_text):
+        rate = match.group(match.lastgroup)
+        tariff_data["tariff_rates"].append(float(rate))
+        
+        # Extract a relevant excerpt around the tariff rate mention
+        start = max(0, match.start() - 150)
+        end = min(len(full_text), match.end() + 150)
+        excerpt = full_text[start:end].strip()
+        if excerpt:
+            tariff_data["relevant_excerpt"] = excerpt
     
     # Extract effective date
-    date_patterns = [
-        r'effective(?:\s+\w+){0,3}\s+(\w+\s+\d{1,2},?\s+\d{4})',  # effective on January 1, 2025
-        r'take(?:\s+\w+){0,2}\s+effect(?:\s+\w+){0,3}\s+(\w+\s+\d{1,2},?\s+\d{4})',  # takes effect on January 1, 2025
-        r'beginning(?:\s+\w+){0,2}\s+(\w+\s+\d{1,2},?\s+\d{4})',  # beginning on January 1, 2025
-        r'implement(?:\s+\w+){0,3}\s+(\w+\s+\d{1,2},?\s+\d{4})'  # implemented on January 1, 2025
-    ]
-    
-    for pattern in date_patterns:
-        matches = re.finditer(pattern, full_text, re.IGNORECASE)
-        for match in matches:
+    for pattern in EFFECTIVE_DATE_PATTERNS:
+        match = pattern.search(full_text)
+        if match:
             tariff_data["effective_date"] = match.group(1)
             break
-        if tariff_data["effective_date"]:
-            break
     
     return tariff_data
 
+def classify_and_extract(post):
+    """
+    Classify a post and, if it is tariff/trade related, extract its tariff data.
+    
+    Args:
+        post: Dictionary containing post details
+        
+    Returns:
+        Dictionary with extracted tariff information, or None for unrelated posts
+    """
+    if not is_tariff_related(post):
+        return None
+    return extract_tariff_data(post)
+
 def scrape_whitehouse_tariff_actions(start_url=BASE_URL, max_pages=MAX_PAGES):
     """
     Scrape White House presidential actions related to tariffs and trade.
@@ -309,7 +483,7 @@ def scrape_whitehouse_tariff_actions(start_url=BASE_URL, max_pages=MAX_PAGES):
     Returns:
         List of dictionaries containing tariff-related actions
     """
-    session = create_session()
+    session = get_session()
     current_url = start_url
     all_posts = []
     tariff_posts = []
@@ -317,40 +491,45 @@ def scrape_whitehouse_tariff_actions(start_url=BASE_URL, max_pages=MAX_PAGES):
 
     while current_url and page_count < max_pages:
         logging.info(f"Processing page {page_count + 1}: {current_url}")
-        page_content = fetch_page(current_url, session)
+        # Listing pages gain new posts, so they are only cached briefly
+        page_content = fetch_page(current_url, session, expire_after=LISTING_CACHE_EXPIRY)
         if not page_content:
             logging.error(f"Failed to fetch content from {current_url}. Stopping pagination.")
             break
 
-        posts = parse_post_list(page_content, current_url)
+        tree = parse_listing(page_content)
+        posts = parse_post_list(tree, current_url)
+        scrape_full_texts(posts, session)
         for post in posts:
-            if post["url"]:
-                logging.debug(f"Scraping full text for post: {post['title']} from {post['url']}")
-                post["full_text"] = scrape_full_text(post["url"], session)
-            else:
-                post["full_text"] = ""
-                
             all_posts.append(post)
             
-            # Check if post is tariff-related
-            if is_tariff_related(post):
-                tariff_data = extract_tariff_data(post)
+            tariff_data = classify_and_extract(post)
+            if tariff_data:
                 tariff_posts.append(tariff_data)
-            
-            time.sleep(REQUEST_DELAY)  # Pause between post requests
 
-        next_page = find_next_page(page_content, current_url)
+        next_page = find_next_page(tree, current_url)
         current_url = next_page
         page_count += 1
-        time.sleep(REQUEST_DELAY)  # Pause between page requests
 
     logging.info(f"Scraping complete. Total posts: {len(all_posts)}, Tariff-related posts: {len(tariff_posts)}")
     return tariff_posts
 
 def store_to_excel(data, filename="whitehouse_tariff_data.xlsx"):
-    """Store scraped data into an Excel file using pandas."""
-    df = pd.DataFrame(data)
-    df.to_excel(filename, index=False)
+    """Store scraped data into an Excel file using a write-only openpyxl workbook."""
+    # Columns in order of first appearance, as a DataFrame would build them
+    columns = list(dict.fromkeys(key for row in data for key in row))
+    
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    if columns:
+        sheet.append(columns)
+    for row in data:
+        # Excel cells cannot hold lists, so those are written as text
+        sheet.append([
+            str(value) if isinstance(value, (list, tuple, dict)) else value
+            for value in (row.get(column) for column in columns)
+        ])
+    workbook.save(filename)
     logging.info(f"Data successfully written to {filename}")
 
 def store_to_json(data, output_dir="data"):
@@ -366,23 +545,25 @@ def store_to_json(data, output_dir="data"):
     os.makedirs(output_dir, exist_ok=True)
     
     # Create timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    payload = {
+        "timestamp": now.isoformat(),
+        "data": data
+    }
     
     # Save timestamped version
     timestamped_filename = os.path.join(output_dir, f"whitehouse_tariff_data_{timestamp}.json")
-    with open(timestamped_filename, 'w') as f:
-        json.dump({
-            "timestamp": datetime.now().isoformat(),
-            "data": data
-        }, f, indent=2)
+    with open(timestamped_filename, 'wb') as f:
+        f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
     
-    # Save latest version for dashboard
+    # Save compact latest version for dashboard, swapped in atomically so the
+    # dashboard never reads a partial file
     latest_filename = os.path.join(output_dir, "whitehouse_data_latest.json")
-    with open(latest_filename, 'w') as f:
-        json.dump({
-            "timestamp": datetime.now().isoformat(),
-            "data": data
-        }, f, indent=2)
+    tmp_filename = latest_filename + ".tmp"
+    with open(tmp_filename, 'wb') as f:
+        f.write(orjson.dumps(payload))
+    os.replace(tmp_filename, latest_filename)
     
     logging.info(f"Data successfully written to {timestamped_filename} and {latest_filename}")
     
@@ -9,16 +9,26 @@ import and export prohibitions and restrictions from the WTO QR API.
 
 import os
 import sys
-import json
+import gzip
 import time
+import orjson
 import logging
+import threading
 import argparse
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import requests
+from cachetools import LRUCache
 from typing import Dict, List, Any, Optional, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import chain
 from datetime import datetime, timedelta
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from requests_cache import CachedSession
 
 # Configure logging
 logging.basicConfig(
@@ -39,7 +49,21 @@ class WTOQuantitativeRestrictionsAPI:
     """
     
     BASE_URL = "https://api.wto.org/qrs"
+    MAX_CONCURRENT_REQUESTS = 8  # Pages fetched in parallel once the page count is known
+    MAX_CONCURRENT_COUNTRIES = 16  # Countries crawled in parallel by fetch_in_force_restrictions
+    MAX_CONNECTIONS = 16  # Kept-alive connections to the API, shared by all of the above
+    CACHE_EXPIRY = timedelta(hours=6)  # How long API responses are reused from the on-disk cache
+    CACHE_SIZE = 1024  # Decoded responses kept in memory; older ones are re-read from disk
     
+    # Fixed columns built by transform_qr_to_dataframe; measures and notifications
+    # are numbered per item (measure_1_flow, notification_1_date, ...)
+    QR_COLUMNS = (
+        "id", "in_force_from", "termination_dt", "general_description", "national_legal_bases",
+        "administrative_mechanisms", "reporter_code", "reporter_name_en", "restrictions"
+    )
+    QR_MEASURE_FIELDS = ("flow", "symbol", "group", "description_en")
+    QR_NOTIFICATION_FIELDS = ("date", "document", "url")
+
     def __init__(self, api_key: str = None, retry_attempts: int = 3, 
                  timeout: int = 30, output_dir: str = "data"):
         """
@@ -59,8 +83,13 @@ class WTOQuantitativeRestrictionsAPI:
         self.output_dir = output_dir
         self.session = self._create_session(retry_attempts)
         
-        # Cache for API responses to reduce redundant calls
-        self._cache = {}
+        # In-process LRU of decoded responses as (data, stored_at); the session also
+        # caches them on disk and revalidates expired ones with If-None-Match
+        self._cache = LRUCache(maxsize=self.CACHE_SIZE)
+        self._cache_lock = threading.Lock()  # Requests run on several threads
+        
+        # Futures for requests currently on the wire, so concurrent identical requests share one
+        self._in_flight = {}
         
         # Ensure output directory exists
         os.makedirs(self.output_dir, exist_ok=True)
@@ -69,26 +98,52 @@ class WTOQuantitativeRestrictionsAPI:
         """
         Create a requests session with retry capability.
         
+        Successful GET responses are cached in an SQLite file in the output
+        directory, so repeated extractions are served from disk instead of the API.
+        
         Args:
             retry_attempts: Maximum number of retries
             
         Returns:
             Configured requests session
         """
-        session = requests.Session()
+        session = CachedSession(
+            cache_name=os.path.join(self.output_dir, "wto_cache"),
+            backend="sqlite",
+            expire_after=self.CACHE_EXPIRY,
+            allowable_methods=["GET"],
+            match_headers=False,
+            cache_control=True,
+            ignored_parameters=["Ocp-Apim-Subscription-Key"]  # Redacted, so the API key is not stored in the cache file
+        )
         
         # Configure retry strategy
         retry_strategy = Retry(
             total=retry_attempts,
             backoff_factor=0.5,
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]  # In newer versions, method_whitelist was renamed to allowed_methods
+            allowed_methods=["GET", "POST"],  # In newer versions, method_whitelist was renamed to allowed_methods
+            respect_retry_after_header=True,  # Rate-limited (429) responses wait as long as the API asks
+            backoff_max=30,
+            raise_on_status=False  # Hand the last failed response to _make_request instead of raising RetryError
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # All requests go to one host; keep MAX_CONNECTIONS kept-alive connections and make
+        # extra threads wait for one rather than open throwaway sockets
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=1,
+            pool_maxsize=self.MAX_CONNECTIONS,
+            pool_block=True
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
+        # Headers shared by every request are set once on the session
+        session.headers["Accept"] = "application/json"
+        if self.api_key:
+            session.headers["Ocp-Apim-Subscription-Key"] = self.api_key
+        
         return session
     
     def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -107,35 +162,69 @@ class WTOQuantitativeRestrictionsAPI:
         """
         url = f"{self.BASE_URL}/{endpoint}"
         params = params or {}
-        headers = {}
         
-        # Add API key to headers if available
-        if self.api_key:
-            headers['Ocp-Apim-Subscription-Key'] = self.api_key
+        # Create cache key based on url and params (bytes hash natively as dict keys)
+        cache_key = url.encode() + b"?" + orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+        
+        # Return cached result if available; once it is older than CACHE_EXPIRY the request
+        # goes to the session, which turns an unchanged response into a 304 revalidation
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[1] < self.CACHE_EXPIRY.total_seconds():
+                logger.debug(f"Using cached result for {url}")
+                return cached[0]
+            
+            # Wait for an identical request already in flight instead of sending another
+            pending = self._in_flight.get(cache_key)
+            if pending is None:
+                future = self._in_flight[cache_key] = Future()
         
-        # Create cache key based on url and params
-        cache_key = f"{url}:{json.dumps(params, sort_keys=True)}"
+        if pending is not None:
+            logger.debug(f"Waiting for in-flight request to {url}")
+            return pending.result()
         
-        # Return cached result if available
-        if cache_key in self._cache:
-            logger.debug(f"Using cached result for {url}")
-            return self._cache[cache_key]
+        try:
+            data = self._get_json(url, params)
+            
+            # Cache successful responses
+            with self._cache_lock:
+                self._cache[cache_key] = (data, time.monotonic())
+        except BaseException as e:
+            # Waiters must be released even on KeyboardInterrupt/SystemExit
+            future.set_exception(e)
+            raise
+        finally:
+            with self._cache_lock:
+                del self._in_flight[cache_key]
+        future.set_result(data)
+        return data
+    
+    def _get_json(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send one GET to the WTO QR API and decode the JSON body.
         
+        Args:
+            url: Full endpoint URL
+            params: Query parameters
+            
+        Returns:
+            JSON response from API
+            
+        Raises:
+            Exception: If API request fails
+        """
         try:
             logger.debug(f"Making request to {url} with params: {params}")
             response = self.session.get(
                 url, 
                 params=params, 
-                headers=headers,
                 timeout=self.timeout
             )
             
             # Handle response based on status code
             if response.status_code == 200:
-                data = response.json()
-                # Cache successful responses
-                self._cache[cache_key] = data
-                return data
+                # orjson parses the raw bytes directly, skipping the str decode
+                return orjson.loads(response.content)
             elif response.status_code == 401:
                 logger.error("Authentication failed - invalid or missing API key")
                 raise Exception(f"API authentication failed: {response.text}. Please check your WTO API subscription key.")
@@ -143,9 +232,9 @@ class WTOQuantitativeRestrictionsAPI:
                 logger.error(f"Validation error: {response.text}")
                 raise Exception(f"API validation error: {response.text}. Please check your request parameters.")
             elif response.status_code == 429:
-                logger.warning("Rate limit exceeded. Waiting before retry.")
-                time.sleep(10)  # Wait before retrying
-                return self._make_request(endpoint, params)  # Retry recursively
+                # The session's Retry adapter has already waited and retried
+                logger.error("Rate limit exceeded after retries")
+                raise Exception(f"API rate limit exceeded: {response.text}")
             else:
                 logger.error(f"API request failed: {response.status_code} - {response.text}")
                 raise Exception(f"API request failed: {response.status_code} - {response.text}")
@@ -314,74 +403,127 @@ class WTOQuantitativeRestrictionsAPI:
             logger.warning("No QR data to transform")
             return pd.DataFrame()
         
-        # Create a list to hold the transformed data
-        transformed_data = []
-        
+        # Skip non-dictionary items
+        records = [qr for qr in qrs if isinstance(qr, dict)]
         for qr in qrs:
-            try:
-                # Skip non-dictionary items
-                if not isinstance(qr, dict):
-                    logger.warning(f"Skipping non-dictionary QR data: {qr}")
-                    continue
-                    
-                # Extract basic QR information
-                qr_info = {
-                    "id": qr.get("id"),
-                    "in_force_from": qr.get("in_force_from"),
-                    "termination_dt": qr.get("termination_dt"),
-                    "general_description": qr.get("general_description"),
-                    "national_legal_bases": qr.get("national_legal_bases"),
-                    "administrative_mechanisms": qr.get("administrative_mechanisms"),
-                }
-                
-                # Extract reporter member info
-                reporter_member = qr.get("reporter_member", {})
-                if isinstance(reporter_member, dict):
-                    qr_info["reporter_code"] = reporter_member.get("code")
-                    name_obj = reporter_member.get("name", {})
-                    if isinstance(name_obj, dict):
-                        qr_info["reporter_name_en"] = name_obj.get("en")
-                
-                # Extract restriction types
-                restrictions = qr.get("restrictions", [])
-                if isinstance(restrictions, list):
-                    qr_info["restrictions"] = ", ".join(restrictions)
-                
-                # Extract measures information
-                measures = qr.get("measures", [])
-                if isinstance(measures, list):
-                    for i, measure in enumerate(measures):
-                        if isinstance(measure, dict):
-                            qr_info[f"measure_{i+1}_flow"] = measure.get("flow")
-                            qr_info[f"measure_{i+1}_symbol"] = measure.get("symbol")
-                            qr_info[f"measure_{i+1}_group"] = measure.get("group_name")
-                            
-                            description = measure.get("description", {})
-                            if isinstance(description, dict):
-                                qr_info[f"measure_{i+1}_description_en"] = description.get("en")
-                
-                # Extract notification information
-                notifications = qr.get("notified_in", [])
-                if isinstance(notifications, list):
-                    for i, notification in enumerate(notifications):
-                        if isinstance(notification, dict):
-                            qr_info[f"notification_{i+1}_date"] = notification.get("notification_dt")
-                            qr_info[f"notification_{i+1}_document"] = notification.get("document_symbol")
-                            qr_info[f"notification_{i+1}_url"] = notification.get("document_url")
-                
-                transformed_data.append(qr_info)
-            except Exception as e:
-                logger.warning(f"Error processing QR {qr.get('id', 'unknown')}: {str(e)}")
-                continue
-        
-        # Convert to DataFrame
-        if transformed_data:
-            df = pd.DataFrame(transformed_data)
-            logger.info(f"Transformed {len(transformed_data)} QR records to DataFrame")
-            return df
-        else:
+            if not isinstance(qr, dict):
+                logger.warning(f"Skipping non-dictionary QR data: {qr}")
+        
+        if not records:
             logger.warning("No QR data was successfully transformed")
             return pd.DataFrame()
+        
+        # One fixed-shape row per QR; list fields are handled separately below
+        rows = [None] * len(records)
+        for i, qr in enumerate(records):
+            reporter_member = qr.get("reporter_member")
+            if not isinstance(reporter_member, dict):
+                reporter_member = {}
+            name_obj = reporter_member.get("name")
+            if not isinstance(name_obj, dict):
+                name_obj = {}
+            restrictions = qr.get("restrictions")
+            
+            # Same order as QR_COLUMNS
+            rows[i] = (
+                qr.get("id"),
+                qr.get("in_force_from"),
+                qr.get("termination_dt"),
+                qr.get("general_description"),
+                qr.get("national_legal_bases"),
+                qr.get("administrative_mechanisms"),
+                reporter_member.get("code"),
+                name_obj.get("en"),
+                ", ".join(map(str, restrictions)) if isinstance(restrictions, list) else None
+            )
+        base = pd.DataFrame.from_records(rows, columns=self.QR_COLUMNS)
+        
+        # Lists of measures and notifications become numbered columns (measure_1_flow, ...)
+        measures = self._pivot_qr_list(
+            records, "measures", "measure", self.QR_MEASURE_FIELDS, self._measure_row
+        )
+        notifications = self._pivot_qr_list(
+            records, "notified_in", "notification", self.QR_NOTIFICATION_FIELDS, self._notification_row
+        )
+        
+        df = pd.concat([base, measures, notifications], axis=1)
+        
+        # Reporter and measure classification columns repeat a handful of values
+        category_columns = ["reporter_code", "reporter_name_en"] + [
+            column for column in df.columns
+            if column.startswith("measure_") and column.endswith(("_flow", "_symbol", "_group"))
+        ]
+        df[category_columns] = df[category_columns].astype("category")
+
+        # QR ids are small integers, so don't hold them as int64
+        for column in df.select_dtypes("int64").columns:
+            df[column] = pd.to_numeric(df[column], downcast="integer")
+
+        logger.info(f"Transformed {len(df)} QR records to DataFrame")
+        return df
+    
+    @staticmethod
+    def _measure_row(measure: Dict[str, Any]) -> tuple:
+        """Extract one QR measure's fields, in QR_MEASURE_FIELDS order."""
+        description = measure.get("description")
+        return (
+            measure.get("flow"),
+            measure.get("symbol"),
+            measure.get("group_name"),
+            description.get("en") if isinstance(description, dict) else None
+        )
+    
+    @staticmethod
+    def _notification_row(notification: Dict[str, Any]) -> tuple:
+        """Extract one QR notification's fields, in QR_NOTIFICATION_FIELDS order."""
+        return (
+            notification.get("notification_dt"),
+            notification.get("document_symbol"),
+            notification.get("document_url")
+        )
+    
+    def _pivot_qr_list(self, records: List[Dict[str, Any]], field: str, prefix: str,
+                       fields: tuple, extract_row) -> pd.DataFrame:
+        """
+        Pivot a list-valued QR field into numbered wide columns.
+        
+        The items are collected into one long-form DataFrame indexed by
+        (record position, item number) and unstacked once, instead of
+        growing every record's dict with numbered keys.
+        
+        Args:
+            records: QR dictionaries
+            field: Name of the list field on each QR (e.g. "measures")
+            prefix: Column prefix (e.g. "measure" gives measure_1_flow)
+            fields: Column suffixes, in the order extract_row returns them
+            extract_row: Callable turning one item into a tuple of fields
+            
+        Returns:
+            DataFrame aligned positionally with records
+        """
+        rows = []
+        positions = []
+        numbers = []
+        for position, qr in enumerate(records):
+            items = qr.get(field)
+            if isinstance(items, list):
+                for number, item in enumerate(items, 1):
+                    if isinstance(item, dict):
+                        rows.append(extract_row(item))
+                        positions.append(position)
+                        numbers.append(number)
+        
+        if not rows:
+            return pd.DataFrame(index=range(len(records)))
+        
+        long_df = pd.DataFrame.from_records(rows, columns=fields)
+        long_df.index = pd.MultiIndex.from_arrays([positions, numbers], names=["position", "number"])
+        wide = long_df.unstack("number").reindex(range(len(records)))
+        
+        # Order columns by item number first, then field, as measure_1_*, measure_2_*, ...
+        wide = wide[[(name, number) for number in sorted(set(numbers)) for name in fields]]
+        wide.columns = [f"{prefix}_{number}_{name}" for name, number in wide.columns]
+        return wide
     
     def transform_qr_detail_to_dataframe(self, qr_detail: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
         """
@@ -472,13 +614,14 @@ class WTOQuantitativeRestrictionsAPI:
             "notifications": notifications_df
         }
     
-    def save_to_csv(self, df: pd.DataFrame, filename: str) -> str:
+    def save_to_csv(self, df: pd.DataFrame, filename: str, table: Optional[pa.Table] = None) -> str:
         """
         Save DataFrame to CSV file.
         
         Args:
             df: Pandas DataFrame to save
             filename: Base filename (without extension)
+            table: Arrow table already converted from df, if the caller has one
             
         Returns:
             Path to the saved file
@@ -488,8 +631,62 @@ class WTOQuantitativeRestrictionsAPI:
         full_filename = f"{filename}_{timestamp}.csv"
         filepath = os.path.join(self.output_dir, full_filename)
         
-        # Save to CSV
-        df.to_csv(filepath, index=False)
+        # Save to CSV, letting Arrow serialize the columns in C. Arrow's dialect is not
+        # df.to_csv's: the header and every string field are quoted, whole floats are
+        # written without a decimal point (2, not 2.0) and booleans as true/false
+        try:
+            if table is None:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+            pacsv.write_csv(table, filepath)
+        except pa.ArrowException as e:
+            # Mixed-type object columns cannot be converted to Arrow
+            logger.debug(f"Falling back to pandas CSV writer: {str(e)}")
+            df.to_csv(filepath, index=False)
+        logger.info(f"Data saved to {filepath}")
+        
+        return filepath
+    
+    def save_to_parquet(self, df: pd.DataFrame, filename: str) -> str:
+        """
+        Save DataFrame to a zstd-compressed Parquet file.
+        
+        Args:
+            df: Pandas DataFrame to save
+            filename: Base filename (without extension)
+            
+        Returns:
+            Path to the saved file
+        """
+        # Add timestamp and extension
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        full_filename = f"{filename}_{timestamp}.parquet"
+        filepath = os.path.join(self.output_dir, full_filename)
+        
+        # Save to Parquet
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, filepath, compression="zstd")
+        logger.info(f"Data saved to {filepath}")
+        
+        return filepath
+    
+    def save_to_ndjson(self, df: pd.DataFrame, filename: str) -> str:
+        """
+        Save DataFrame to a newline-delimited JSON file, one record per line.
+        
+        Args:
+            df: Pandas DataFrame to save
+            filename: Base filename (without extension)
+            
+        Returns:
+            Path to the saved file
+        """
+        # Add timestamp and extension
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        full_filename = f"{filename}_{timestamp}.ndjson"
+        filepath = os.path.join(self.output_dir, full_filename)
+        
+        # Save to NDJSON so readers can parse it line by line
+        df.to_json(filepath, orient='records', lines=True, date_format='iso')
         logger.info(f"Data saved to {filepath}")
         
         return filepath
@@ -510,17 +707,107 @@ class WTOQuantitativeRestrictionsAPI:
         full_filename = f"{filename}_{timestamp}.json"
         filepath = os.path.join(self.output_dir, full_filename)
         
-        # Save to JSON
-        with open(filepath, 'w') as f:
-            if isinstance(data, pd.DataFrame):
-                f.write(data.to_json(orient='records', date_format='iso'))
-            else:
-                json.dump(data, f, indent=2)
+        # Save to JSON; pandas' C writer handles frames, orjson everything else
+        if isinstance(data, pd.DataFrame):
+            data.to_json(filepath, orient='records', date_format='iso')
+        else:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Data saved to {filepath}")
         
         return filepath
     
+    def _paginate(self, label: str = "", skip_failed_pages: bool = False,
+                  concurrent_pages: bool = True, **filters) -> List[Dict[str, Any]]:
+        """
+        Fetch every page of a QR listing.
+        
+        Page 1 is fetched first to learn last_page; pages 2..last_page are then
+        fetched concurrently on a thread pool sharing the session, or one after
+        another when the caller is already running several listings in parallel.
+        An error on any page propagates unless skip_failed_pages is set, in which
+        case failed later pages are logged and skipped.
+        
+        Args:
+            label: Suffix describing the query in log messages (e.g. " for country C840")
+            skip_failed_pages: Return the pages that did load instead of raising
+            concurrent_pages: Fetch pages 2..last_page on a thread pool
+            **filters: Filters passed to get_qr_list
+            
+        Returns:
+            QR records from all pages, in page order
+        """
+        response = self.get_qr_list(page=1, **filters)
+        
+        # Process first page
+        if not isinstance(response, dict) or not isinstance(response.get("data"), list):
+            logger.warning(f"Unexpected format in initial response{label}")
+            return []
+        
+        logger.info(f"Found {len(response['data'])} QRs{label} (page 1)")
+        qrs = list(response["data"])
+        
+        # Check if there are more pages
+        meta = response.get("meta")
+        if not isinstance(meta, dict):
+            return qrs
+        pages = range(meta.get("current_page", 1) + 1, meta.get("last_page", 1) + 1)
+        if not pages:
+            return qrs
+        
+        def fetch_page(page):
+            logger.info(f"Fetching page {page}{label}")
+            try:
+                return self.get_qr_list(page=page, **filters)
+            except Exception as e:
+                logger.error(f"Error fetching page {page}{label}: {str(e)}")
+                if not skip_failed_pages:
+                    raise
+                return None
+        
+        # Fetch remaining pages, keeping page order
+        if concurrent_pages:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_REQUESTS, len(pages))) as executor:
+                page_responses = list(executor.map(fetch_page, pages))
+        else:
+            page_responses = [fetch_page(page) for page in pages]
+        
+        for page, page_response in zip(pages, page_responses):
+            if isinstance(page_response, dict) and isinstance(page_response.get("data"), list):
+                logger.info(f"Found {len(page_response['data'])} QRs{label} (page {page})")
+                qrs.extend(page_response["data"])
+            elif page_response is not None:
+                logger.warning(f"Unexpected format in page {page} response{label}")
+        
+        return qrs
+    
+    def _fetch_country(self, country_code: str, concurrent_pages: bool = True, **filters) -> List[Dict[str, Any]]:
+        """
+        Fetch all QRs reported by one country.
+        
+        Args:
+            country_code: WTO member code
+            concurrent_pages: Fetch the country's pages on a thread pool (see _paginate)
+            **filters: Further filters passed to get_qr_list
+            
+        Returns:
+            QR records for the country, empty if the request failed
+        """
+        logger.info(f"Fetching restrictions for country {country_code}")
+        
+        try:
+            return self._paginate(
+                f" for country {country_code}",
+                skip_failed_pages=True,
+                concurrent_pages=concurrent_pages,
+                reporter_member_code=country_code,
+                **filters
+            )
+        except Exception as e:
+            logger.error(f"Error fetching QRs for country {country_code}: {str(e)}")
+            return []
+    
     def fetch_in_force_restrictions(self, countries: List[str] = None) -> pd.DataFrame:
         """
         Fetch currently in-force quantitative restrictions, optionally filtered by countries.
@@ -534,84 +821,18 @@ class WTOQuantitativeRestrictionsAPI:
         all_qrs = []
         
         if countries:
-            # Fetch QRs for each country
-            for country_code in countries:
-                logger.info(f"Fetching in-force restrictions for country {country_code}")
-                
-                try:
-                    response = self.get_qr_list(
-                        reporter_member_code=country_code,
-                        in_force_only=True,
-                        page=1
-                    )
-                    
-                    # Process first page
-                    if isinstance(response, dict) and "data" in response and isinstance(response["data"], list):
-                        logger.info(f"Found {len(response['data'])} QRs for country {country_code} (page 1)")
-                        all_qrs.extend(response["data"])
-                    
-                        # Check if there are more pages
-                        if "meta" in response and isinstance(response["meta"], dict):
-                            meta = response["meta"]
-                            current_page = meta.get("current_page", 1)
-                            last_page = meta.get("last_page", 1)
-                            
-                            # Fetch remaining pages
-                            for page in range(current_page + 1, last_page + 1):
-                                logger.info(f"Fetching page {page} for country {country_code}")
-                                
-                                try:
-                                    page_response = self.get_qr_list(
-                                        reporter_member_code=country_code,
-                                        in_force_only=True,
-                                        page=page
-                                    )
-                                    
-                                    if isinstance(page_response, dict) and "data" in page_response and isinstance(page_response["data"], list):
-                                        logger.info(f"Found {len(page_response['data'])} QRs for country {country_code} (page {page})")
-                                        all_qrs.extend(page_response["data"])
-                                    else:
-                                        logger.warning(f"Unexpected format in page {page} response for country {country_code}")
-                                except Exception as e:
-                                    logger.error(f"Error fetching page {page} for country {country_code}: {str(e)}")
-                    else:
-                        logger.warning(f"Unexpected format in initial response for country {country_code}")
-                except Exception as e:
-                    logger.error(f"Error fetching QRs for country {country_code}: {str(e)}")
+            # Fetch QRs for the countries concurrently, keeping the country order. With
+            # several countries in flight each one reads its pages in turn, so the thread
+            # count stays within MAX_CONNECTIONS
+            with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_COUNTRIES, len(countries))) as executor:
+                fetch_country = partial(self._fetch_country, concurrent_pages=len(countries) == 1, in_force_only=True)
+                all_qrs = list(chain.from_iterable(executor.map(fetch_country, countries)))
         else:
             # Fetch all in-force QRs
             logger.info("Fetching all in-force restrictions")
             
             try:
-                response = self.get_qr_list(in_force_only=True, page=1)
-                
-                # Process first page
-                if isinstance(response, dict) and "data" in response and isinstance(response["data"], list):
-                    logger.info(f"Found {len(response['data'])} QRs (page 1)")
-                    all_qrs.extend(response["data"])
-                
-                    # Check if there are more pages
-                    if "meta" in response and isinstance(response["meta"], dict):
-                        meta = response["meta"]
-                        current_page = meta.get("current_page", 1)
-                        last_page = meta.get("last_page", 1)
-                        
-                        # Fetch remaining pages
-                        for page in range(current_page + 1, last_page + 1):
-                            logger.info(f"Fetching page {page}")
-                            
-                            try:
-                                page_response = self.get_qr_list(in_force_only=True, page=page)
-                                
-                                if isinstance(page_response, dict) and "data" in page_response and isinstance(page_response["data"], list):
-                                    logger.info(f"Found {len(page_response['data'])} QRs (page {page})")
-                                    all_qrs.extend(page_response["data"])
-                                else:
-                                    logger.warning(f"Unexpected format in page {page} response")
-                            except Exception as e:
-                                logger.error(f"Error fetching page {page}: {str(e)}")
-                else:
-                    logger.warning("Unexpected format in initial response")
+                all_qrs = self._paginate(skip_failed_pages=True, in_force_only=True)
             except Exception as e:
                 logger.error(f"Error fetching all QRs: {str(e)}")
         
@@ -622,13 +843,15 @@ class WTOQuantitativeRestrictionsAPI:
         
         return pd.DataFrame()
     
-    def fetch_qr_details_for_products(self, product_codes: List[str], hs_version: str) -> pd.DataFrame:
+    def fetch_qr_details_for_products(self, product_codes: List[str], hs_version: str,
+                                      countries: List[str] = None) -> pd.DataFrame:
         """
-        Fetch QRs affecting specific products.
+        Fetch QRs affecting specific products, optionally only those reported by some countries.
         
         Args:
             product_codes: List of product codes
             hs_version: HS version code
+            countries: Optional list of country codes, filtered by the API
             
         Returns:
             DataFrame with QR data
@@ -639,28 +862,22 @@ class WTOQuantitativeRestrictionsAPI:
         product_ids = [f"{hs_version}-{code}" for code in product_codes]
         product_ids_str = ",".join(product_ids)
         
-        # Fetch QRs
-        response = self.get_qr_list(product_ids=product_ids_str, page=1)
-        
-        all_qrs = []
-        
-        # Process first page
-        if isinstance(response, dict) and "data" in response:
-            all_qrs.extend(response["data"])
-        
-        # Check if there are more pages
-        if isinstance(response, dict) and "meta" in response:
-            meta = response["meta"]
-            current_page = meta.get("current_page", 1)
-            last_page = meta.get("last_page", 1)
-            
-            # Fetch remaining pages
-            for page in range(current_page + 1, last_page + 1):
-                logger.info(f"Fetching page {page}")
-                page_response = self.get_qr_list(product_ids=product_ids_str, page=page)
-                
-                if isinstance(page_response, dict) and "data" in page_response:
-                    all_qrs.extend(page_response["data"])
+        # Fetch QRs, asking the API for each country rather than filtering afterwards.
+        # Unlike _fetch_country, a failed country is not swallowed: it fails the whole
+        # product query, as the single unfiltered query would
+        if countries:
+            def fetch_country(country_code):
+                return self._paginate(
+                    f" for country {country_code}",
+                    concurrent_pages=len(countries) == 1,  # Keeps the thread count within MAX_CONNECTIONS
+                    reporter_member_code=country_code,
+                    product_ids=product_ids_str
+                )
+            
+            with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_COUNTRIES, len(countries))) as executor:
+                all_qrs = list(chain.from_iterable(executor.map(fetch_country, countries)))
+        else:
+            all_qrs = self._paginate(product_ids=product_ids_str)
         
         # Create a dataframe from all QRs
         if all_qrs:
@@ -683,10 +900,12 @@ class WTOQuantitativeRestrictionsAPI:
             Dictionary with file paths and summary information
         """
         start_time = datetime.now()
+        start_iso = start_time.isoformat()  # Also stamps the latest snapshot
+        start_stamp = start_time.strftime('%Y%m%d_%H%M%S')
         logger.info(f"Starting QR data extraction at {start_time}")
         
         result = {
-            "timestamp": start_time.isoformat(),
+            "timestamp": start_iso,
             "files": {},
             "summary": {
                 "countries": len(countries) if countries else "all",
@@ -696,6 +915,17 @@ class WTOQuantitativeRestrictionsAPI:
             }
         }
         
+        # The execution report is written as it goes, one JSON event per line,
+        # so the diagnostics survive even if the run dies part way
+        report_file = os.path.join(self.output_dir, f"qr_extraction_report_{start_stamp}.ndjson")
+        report = open(report_file, 'ab')
+        
+        def emit(event: str, **fields) -> None:
+            report.write(orjson.dumps({"event": event, "time": datetime.now().isoformat(), **fields}) + b"\n")
+            report.flush()
+        
+        emit("start", filters=result["summary"])
+        
         try:
             # 1. Fetch HS versions first
             logger.info("Fetching HS versions")
@@ -703,6 +933,7 @@ class WTOQuantitativeRestrictionsAPI:
             hs_versions_file = self.save_to_json(hs_versions, "hs_versions")
             result["files"]["hs_versions"] = hs_versions_file
             result["summary"]["hs_versions_count"] = len(hs_versions)
+            emit("hs_versions", count=len(hs_versions), file=hs_versions_file)
             
             # 2. Fetch countries (members)
             logger.info("Fetching WTO members")
@@ -711,6 +942,7 @@ class WTOQuantitativeRestrictionsAPI:
             members_file = self.save_to_json(members, "wto_members")
             result["files"]["members"] = members_file
             result["summary"]["members_count"] = len(members)
+            emit("members", count=len(members), file=members_file)
             
             # Make sure we have valid country codes
             valid_countries = []
@@ -727,43 +959,65 @@ class WTOQuantitativeRestrictionsAPI:
             if products and len(products) > 0:
                 # Fetch QRs by product codes
                 logger.info(f"Fetching QRs for products: {products}")
-                qr_df = self.fetch_qr_details_for_products(products, hs_version)
-                
-                # If also filtering by country, apply additional filter
-                if valid_countries and len(valid_countries) > 0:
-                    qr_df = qr_df[qr_df["reporter_code"].isin(valid_countries)]
+                qr_df = self.fetch_qr_details_for_products(products, hs_version, valid_countries)
             else:
                 # Fetch QRs by country
                 logger.info(f"Fetching QRs for countries: {valid_countries or 'all'}")
                 qr_df = self.fetch_in_force_restrictions(valid_countries)
             
+            emit("fetched", countries=valid_countries or "all", qr_count=0 if qr_df is None else len(qr_df))
+            
             # Save QR data
             if qr_df is not None and not qr_df.empty:
-                csv_file = self.save_to_csv(qr_df, "quantitative_restrictions")
-                json_file = self.save_to_json(qr_df, "quantitative_restrictions")
+                # Convert to Arrow once; the CSV and Parquet writers share the table
+                try:
+                    qr_table = pa.Table.from_pandas(qr_df, preserve_index=False)
+                except pa.ArrowException as e:
+                    logger.warning(f"Could not convert QR data to Arrow, skipping Parquet output: {str(e)}")
+                    qr_table = None
+                
+                csv_file = self.save_to_csv(qr_df, "quantitative_restrictions", table=qr_table)
+                json_file = self.save_to_ndjson(qr_df, "quantitative_restrictions")
                 
                 result["files"]["qr_csv"] = csv_file
                 result["files"]["qr_json"] = json_file
                 result["summary"]["qr_count"] = len(qr_df)
                 
                 # 4. Save a "latest" version for dashboard use
-                latest_file = os.path.join(self.output_dir, "qr_data_latest.json")
-                qr_dict = json.loads(qr_df.to_json(orient='records', date_format='iso'))
+                latest_file = os.path.join(self.output_dir, "qr_data_latest.json.gz")
+                metadata = {
+                    "countries": valid_countries if valid_countries else "all",
+                    "products": products if products else "all",
+                    "hs_version": hs_version,
+                    "in_force_only": in_force_only,
+                    "source": "WTO Quantitative Restrictions API"
+                }
+                
+                metadata_json = orjson.dumps(metadata)
                 
-                with open(latest_file, 'w') as f:
-                    json.dump({
-                        "timestamp": datetime.now().isoformat(),
-                        "data": qr_dict,
-                        "metadata": {
-                            "countries": valid_countries if valid_countries else "all",
-                            "products": products if products else "all",
-                            "hs_version": hs_version,
-                            "in_force_only": in_force_only,
-                            "source": "WTO Quantitative Restrictions API"
-                        }
-                    }, f, indent=2)
+                # Write the envelope by hand so pandas streams the records straight into
+                # the file, instead of encoding, re-parsing and re-encoding them
+                with gzip.open(latest_file, 'wt', compresslevel=3) as f:
+                    f.write(f'{{"timestamp": "{start_iso}", "data": ')
+                    qr_df.to_json(f, orient='records', date_format='iso')
+                    f.write(f', "metadata": {metadata_json.decode()}}}')
                 
                 result["files"]["latest"] = latest_file
+                
+                # The dashboard reads this Parquet copy; timestamp and metadata travel
+                # in the schema metadata so it stays a single self-describing file
+                if qr_table is not None:
+                    latest_parquet = os.path.join(self.output_dir, "qr_data_latest.parquet")
+                    latest_table = qr_table.replace_schema_metadata({
+                        **qr_table.schema.metadata,
+                        b"timestamp": start_iso.encode(),
+                        b"metadata": metadata_json
+                    })
+                    pq.write_table(latest_table, latest_parquet, compression="snappy")
+                    
+                    result["files"]["latest_parquet"] = latest_parquet
+                
+                emit("saved", files=result["files"])
             else:
                 logger.warning("No QR data found matching the specified filters")
                 result["summary"]["qr_count"] = 0
@@ -784,14 +1038,19 @@ class WTOQuantitativeRestrictionsAPI:
             # Include exception traceback for debugging
             import traceback
             result["summary"]["traceback"] = traceback.format_exc()
-        
-        # Save the execution report
-        report_file = os.path.join(self.output_dir, f"qr_extraction_report_{start_time.strftime('%Y%m%d_%H%M%S')}.json")
-        with open(report_file, 'w') as f:
-            json.dump(result, f, indent=2)
+            emit("error", error=str(e))
+        finally:
+            # The last line carries the full summary and file list
+            emit("done", summary=result["summary"], files=result["files"])
+            report.close()
         
         return result
 
+def comma_list(value: str) -> Optional[List[str]]:
+    """Split a comma-separated argument into trimmed items, or None if it is empty"""
+    items = [item.strip() for item in value.split(',') if item.strip()]
+    return items or None
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description="WTO Quantitative Restrictions API Scraper")
@@ -803,11 +1062,13 @@ def parse_arguments():
     
     parser.add_argument(
         "--countries", 
+        type=comma_list,
         help="Comma-separated list of WTO member codes (e.g., C840,C156,C484)"
     )
     
     parser.add_argument(
         "--products", 
+        type=comma_list,
         help="Comma-separated list of product codes (e.g., 010110,010121)"
     )
     
@@ -866,12 +1127,6 @@ def main():
         logger.error("No WTO API key provided. Use --api-key or set WTO_API_KEY environment variable.")
         sys.exit(1)
     
-    # Parse countries if provided
-    countries = args.countries.split(',') if args.countries else None
-    
-    # Parse products if provided
-    products = args.products.split(',') if args.products else None
-    
     try:
         # Initialize the API client
         client = WTOQuantitativeRestrictionsAPI(
@@ -883,8 +1138,8 @@ def main():
         
         # Run the extraction
         result = client.run_qr_extraction(
-            countries=countries,
-            products=products,
+            countries=args.countries,
+            products=args.products,
             hs_version=args.hs_version,
             in_force_only=args.in_force_only
         )
@@ -1,8 +1,13 @@
 import os
 import json
 import logging
+import threading
 import requests
-from datetime import datetime
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests_cache import CachedSession, DO_NOT_CACHE
 from dotenv import load_dotenv 
 
 load_dotenv()
@@ -29,6 +34,48 @@ HEADERS = {
     "Ocp-Apim-Subscription-Key": API_KEY
 }
 
+# Indicator, reporter and classification lists change at most weekly, so
+# cache them on disk between runs; tariff data is always fetched fresh
+METADATA_CACHE_EXPIRY = timedelta(days=1)
+
+# SQLite file holding cached metadata responses; kept apart from the
+# WTOTimeseriesAPI cache, which applies its own expiry policy
+HTTP_CACHE_NAME = os.path.join("data", "wto_api_cache")
+
+def create_session():
+    """
+    Create a session with pooled connections, retries and an on-disk metadata cache.
+    "Cache-Control: no-cache" would stop the local cache from being read, so
+    only the uncached /data and connection-test requests send it.
+    """
+    session = CachedSession(
+        cache_name=HTTP_CACHE_NAME,
+        backend="sqlite",
+        expire_after=METADATA_CACHE_EXPIRY,
+        urls_expire_after={DATA_ENDPOINT: DO_NOT_CACHE},
+        allowable_methods=["GET"],
+        match_headers=False,
+        ignored_parameters=["Ocp-Apim-Subscription-Key"]  # Redacted, so the API key is not stored in the cache file
+    )
+    session.headers["Ocp-Apim-Subscription-Key"] = API_KEY
+    session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    ))
+    return session
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()  # The fetch functions may be called from several threads
+
+def get_session():
+    """Return the shared session, creating it on first use so importing the module touches no files."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = create_session()
+    return _SESSION
+
 # -----------------------------------------------------------------------------
 # Function: test_connection
 # -----------------------------------------------------------------------------
@@ -48,43 +95,24 @@ def test_connection():
         display_headers['Ocp-Apim-Subscription-Key'] = f"{api_key[:4]}...{api_key[-4:]}"
     logger.info(f"Using headers: {display_headers}")
     
-    # Try a very simple endpoint first
-    endpoints_to_try = [
-        "/years",
-        "/topics",
-        "/frequencies"
-    ]
-    
-    for endpoint_path in endpoints_to_try:
-        try:
-            test_endpoint = f"{API_BASE_URL}{endpoint_path}"
-            logger.info(f"Testing endpoint: {test_endpoint}")
-            
-            response = requests.get(test_endpoint, headers=HEADERS, timeout=10)
-            
-            logger.info(f"Response status: {response.status_code}")
-            logger.info(f"Response headers: {dict(response.headers)}")
-            
-            if response.status_code == 200:
-                logger.info(f"Connection successful to {endpoint_path} (Status 200)")
-                # For years endpoint, show the data
-                if endpoint_path == "/years" and response.text:
-                    try:
-                        years_data = response.json()
-                        if isinstance(years_data, list) and len(years_data) > 0:
-                            logger.info(f"Available years: {years_data[:5]}...")
-                    except:
-                        logger.info(f"Response content (first 100 chars): {response.text[:100]}")
-                return True
-            else:
-                logger.warning(f"Connection to {endpoint_path} failed with status code: {response.status_code}")
-                logger.warning(f"Response content: {response.text[:500]}")
-                # Continue to try other endpoints
-        except Exception as e:
-            logger.warning(f"Connection test to {endpoint_path} failed with error: {e}")
-            # Continue to try other endpoints
+    # A single HEAD to the cheapest endpoint is enough to check the key and the
+    # network; 405 still means the gateway accepted the key
+    test_endpoint = f"{API_BASE_URL}/years"
+    try:
+        logger.info("Testing endpoint: %s", test_endpoint)
+        response = get_session().head(test_endpoint, headers=HEADERS, timeout=5)
+        logger.info("Response status: %s", response.status_code)
+        
+        if response.status_code < 400 or response.status_code == 405:
+            logger.info("Connection successful to /years (Status %s)", response.status_code)
+            return True
+        
+        logger.warning("Connection to /years failed with status code: %s", response.status_code)
+        logger.debug("Response headers: %s", response.headers)
+    except requests.RequestException as e:
+        logger.warning("Connection test to /years failed with error: %s", e)
     
-    logger.error("All connection tests failed")
+    logger.error("Connection test failed")
     return False
 
 # -----------------------------------------------------------------------------
@@ -116,42 +144,39 @@ def fetch_tariff_data(indicator_code, reporting_economy="all", partner_economy="
     }
     
     logger.info(f"Fetching tariff data for indicator: {indicator_code}")
-    logger.info(f"Request parameters: {params}")
+    logger.info("Request parameters: %s", params)
     
     try:
-        # Log the actual URL being requested (for debugging)
-        request = requests.Request('GET', endpoint, params=params, headers=HEADERS)
-        prepared_request = request.prepare()
-        logger.info(f"Request URL: {prepared_request.url}")
+        response = get_session().get(endpoint, params=params, headers=HEADERS, timeout=30)
         
-        # Make the actual request
-        response = requests.get(endpoint, params=params, headers=HEADERS, timeout=30)
-        
-        # Log response status and headers for debugging
-        logger.info(f"Response status: {response.status_code}")
-        logger.info(f"Response headers: {response.headers}")
+        # Log the URL that was actually requested, plus status and headers for debugging
+        logger.info("Request URL: %s", response.url)
+        logger.info("Response status: %s", response.status_code)
+        logger.info("Response headers: %s", response.headers)
         
         # Handle 204 No Content separately
         if response.status_code == 204:
             logger.info("No data available for the requested parameters (204 No Content)")
             return None
         
-        # Try to get response content for other responses
+        # Parse the body once; the raw text is enough for the log preview
+        content = None
         try:
             content = response.json() if response.text else {}
-            logger.info(f"Response content: {json.dumps(content)[:500]}")
-        except:
-            logger.info(f"Response text: {response.text[:500]}")
+            logger.info("Response content: %s", response.text[:500])
+        except ValueError:
+            logger.info("Response text: %s", response.text[:500])
         
         # Now raise for status to handle errors
         response.raise_for_status()
         
-        # For 200 responses, parse and return the data
-        if response.status_code == 200 and response.text:
-            logger.info(f"Tariff data fetched successfully (status code: {response.status_code})")
-            return response.json()
+        # For 200 responses, return the parsed data
+        if response.status_code == 200 and response.text and content is not None:
+            logger.info("Tariff data fetched successfully (status code: %s)", response.status_code)
+            return content
         else:
-            logger.warning(f"Unexpected response (status: {response.status_code}, content length: {len(response.text) if response.text else 0})")
+            logger.warning("Unexpected response (status: %s, content length: %s)",
+                           response.status_code, len(response.text) if response.text else 0)
             return None
     except requests.exceptions.HTTPError as http_err:
         logger.error(f"HTTP error occurred while fetching tariff data: {http_err}")
@@ -196,7 +221,7 @@ def fetch_indicators(i="all", name=None, t="all", pc="all", tp="all", frq="all",
     logger.debug(f"Request parameters: {params}")
     
     try:
-        response = requests.get(endpoint, params=params, headers=HEADERS, timeout=30)
+        response = get_session().get(endpoint, params=params, timeout=30)
         response.raise_for_status()
         logger.info(f"Indicators fetched successfully (status code: {response.status_code})")
         return response.json()
@@ -237,7 +262,7 @@ def fetch_reporters(name=None, ig="all", reg="all", gp="all", lang=1):
     
     logger.info("Fetching reporting economies")
     try:
-        response = requests.get(endpoint, params=params, headers=HEADERS, timeout=30)
+        response = get_session().get(endpoint, params=params, timeout=30)
         response.raise_for_status()
         logger.info(f"Reporting economies fetched successfully (status code: {response.status_code})")
         return response.json()
@@ -269,7 +294,7 @@ def fetch_product_classifications(lang=1):
     
     logger.info("Fetching product classifications")
     try:
-        response = requests.get(endpoint, params=params, headers=HEADERS, timeout=30)
+        response = get_session().get(endpoint, params=params, timeout=30)
         response.raise_for_status()
         logger.info(f"Product classifications fetched successfully (status code: {response.status_code})")
         return response.json()
@@ -318,43 +343,51 @@ def main():
         logger.info(f"API Key being used (first 4 characters): {API_KEY[:4] if API_KEY and len(API_KEY) > 4 else 'None'}")
         return
     
-    # Example 1: Fetch tariff data - using a simpler approach
-    logger.info("EXAMPLE 1: Fetching tariff data")
-    
-    # First, find a valid tariff indicator code
-    logger.info("Looking for valid tariff indicators...")
-    tariff_indicators = fetch_indicators(name="tariff")
-    
-    if tariff_indicators and len(tariff_indicators) > 0:
-        # Use the first tariff indicator we find
-        tariff_indicator = tariff_indicators[0]
-        indicator_code = tariff_indicator["code"]
-        logger.info(f"Using indicator: {indicator_code} - {tariff_indicator.get('name', 'Unknown')}")
+    # The indicator and reporter lookups are independent, so start both now;
+    # the tariff pull below only has to wait for the indicators
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        indicators_future = executor.submit(fetch_indicators, name="tariff")
+        reporters_future = executor.submit(fetch_reporters)
         
-        # Use simpler parameters
-        reporting_economy = "all"  # Start with all economies
-        time_period = "2020"       # Just use a single recent year
-        product_sector = "default" # Use default product sector grouping
+        # Example 1: Fetch tariff data - using a simpler approach
+        logger.info("EXAMPLE 1: Fetching tariff data")
         
-        tariff_data = fetch_tariff_data(
-            indicator_code,
-            reporting_economy=reporting_economy,
-            partner_economy="default",
-            time_period=time_period,
-            product_sector=product_sector,
-            include_sub=False,
-            output_format="json",
-            output_mode="full",
-            decimals="default",
-            offset=0,
-            max_records=100,  # Reduced for testing
-            heading="H",
-            lang=1,
-            include_meta=False
-        )
-    else:
-        logger.error("No tariff indicators found")
-        tariff_data = None
+        # First, find a valid tariff indicator code
+        logger.info("Looking for valid tariff indicators...")
+        tariff_indicators = indicators_future.result()
+        
+        if tariff_indicators and len(tariff_indicators) > 0:
+            # Use the first tariff indicator we find
+            tariff_indicator = tariff_indicators[0]
+            indicator_code = tariff_indicator["code"]
+            logger.info(f"Using indicator: {indicator_code} - {tariff_indicator.get('name', 'Unknown')}")
+            
+            # Use simpler parameters
+            reporting_economy = "all"  # Start with all economies
+            time_period = "2020"       # Just use a single recent year
+            product_sector = "default" # Use default product sector grouping
+            
+            tariff_data = fetch_tariff_data(
+                indicator_code,
+                reporting_economy=reporting_economy,
+                partner_economy="default",
+                time_period=time_period,
+                product_sector=product_sector,
+                include_sub=False,
+                output_format="json",
+                output_mode="full",
+                decimals="default",
+                offset=0,
+                max_records=100,  # Reduced for testing
+                heading="H",
+                lang=1,
+                include_meta=False
+            )
+        else:
+            logger.error("No tariff indicators found")
+            tariff_data = None
+        
+        reporters_data = reporters_future.result()
     
     if tariff_data:
         # Check for both possible response formats
@@ -380,7 +413,7 @@ def main():
     
     # Example 2: Fetch the list of indicators
     logger.info("EXAMPLE 2: Fetching indicator list")
-    indicators_data = fetch_indicators(name="tariff")  # Filtering to indicators with 'tariff' in the name
+    indicators_data = tariff_indicators  # Same 'tariff' name filter as example 1, so reuse it
     
     if indicators_data:
         if isinstance(indicators_data, list):
@@ -403,7 +436,6 @@ def main():
     
     # Example 3: Fetch reporting economies
     logger.info("EXAMPLE 3: Fetching reporting economies")
-    reporters_data = fetch_reporters()
     
     if reporters_data:
         if isinstance(reporters_data, list):
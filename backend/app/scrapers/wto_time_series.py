@@ -10,24 +10,41 @@ and trade data from the WTO Timeseries API for the tariff dashboard project.
 import os
 import sys
 import json
-import time
+import queue
+import atexit
+import orjson
 import logging
+import logging.handlers
+import threading
 import argparse
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import requests
+from cachetools import LRUCache
 from typing import Dict, List, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from requests_cache import CachedSession
+
+# Configure logging; records are formatted and queued on the calling thread,
+# and a background listener thread does the file and console writes
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.FileHandler("wto_scraper.log"),
+    logging.StreamHandler()
+)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush queued records before the interpreter exits
 
-# Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("wto_scraper.log"),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
 
 logger = logging.getLogger("wto_scraper")
@@ -39,10 +56,50 @@ class WTOTimeseriesAPI:
     """
     
     BASE_URL = "http://api.wto.org/timeseries/v1"
+    MAX_CONNECTIONS = 8  # Kept-alive connections to the API, shared by every request
+    REFERENCE_CACHE_EXPIRY = timedelta(days=1)  # Indicators, reporters, products, ... barely change
+    DATA_CACHE_EXPIRY = timedelta(hours=1)  # Responses from the data endpoint
+    CACHE_SIZE = 256  # Decoded responses kept in memory; older ones are re-read from disk
+
+    # WTO API field mapping - corrected based on actual API response; pairs of
+    # (API field, our column), applied in order by transform_to_dataframe
+    FIELD_MAPPINGS = (
+        # Capital case field names from actual API response
+        ("IndicatorCode", "indicator_code"),
+        ("Indicator", "indicator_name"),
+        ("ReportingEconomyCode", "country_code"),
+        ("ReportingEconomy", "country_name"),
+        ("PartnerEconomyCode", "partner_code"),
+        ("PartnerEconomy", "partner_name"),
+        ("ProductOrSectorCode", "product_code"),
+        ("ProductOrSector", "product_name"),
+        ("Year", "year"),
+        ("Period", "period"),
+        ("Frequency", "frequency"),
+        ("Unit", "unit"),
+        ("Value", "value"),
+        ("ValueFlagCode", "flag"),
+
+        # Original camelCase field names kept as backup
+        ("indicatorCode", "indicator_code"),
+        ("indicator", "indicator_name"),
+        ("reportingEconomyCode", "country_code"),
+        ("reportingEconomy", "country_name"),
+        ("partnerEconomyCode", "partner_code"),
+        ("partnerEconomy", "partner_name"),
+        ("productOrSectorCode", "product_code"),
+        ("productOrSector", "product_name"),
+        ("year", "year"),
+        ("period", "period"),
+        ("frequency", "frequency"),
+        ("unit", "unit"),
+        ("value", "value"),
+        ("valueFlagCode", "flag"),
+    )
     
     def __init__(self, api_key: str = None, retry_attempts: int = 3, 
                  timeout: int = 60, output_dir: str = "data",
-                 batch_size: int = 5):
+                 batch_size: int = 5, concurrency: int = 4):
         """
         Initialize the WTO API client.
         
@@ -52,6 +109,7 @@ class WTOTimeseriesAPI:
             timeout: Request timeout in seconds
             output_dir: Directory to save output files
             batch_size: Number of countries to include in a single request
+            concurrency: Maximum number of country batches requested at the same time
         """
         self.api_key = api_key or os.environ.get('WTO_API_KEY')
         if not self.api_key:
@@ -60,10 +118,12 @@ class WTOTimeseriesAPI:
         self.timeout = timeout
         self.output_dir = output_dir
         self.batch_size = batch_size
+        self.concurrency = max(1, concurrency)
         self.session = self._create_session(retry_attempts)
         
         # Cache for API responses to reduce redundant calls
-        self._cache = {}
+        self._cache = LRUCache(maxsize=self.CACHE_SIZE)
+        self._cache_lock = threading.Lock()  # Batches are fetched on several threads
         
         # Ensure output directory exists
         os.makedirs(self.output_dir, exist_ok=True)
@@ -72,26 +132,52 @@ class WTOTimeseriesAPI:
         """
         Create a requests session with retry capability.
         
+        Successful GET responses are cached in an SQLite file in the output
+        directory, so restarted or parallel runs reuse them instead of the API.
+        
         Args:
             retry_attempts: Maximum number of retries
             
         Returns:
             Configured requests session
         """
-        session = requests.Session()
+        session = CachedSession(
+            cache_name=os.path.join(self.output_dir, "wto_timeseries_cache"),
+            backend="sqlite",
+            expire_after=self.REFERENCE_CACHE_EXPIRY,
+            urls_expire_after={f"{self.BASE_URL}/data": self.DATA_CACHE_EXPIRY},
+            allowable_methods=["GET"],
+            match_headers=False,
+            cache_control=True,
+            ignored_parameters=["Ocp-Apim-Subscription-Key"]  # Redacted, so the API key is not stored in the cache file
+        )
         
         # Configure retry strategy with exponential backoff
         retry_strategy = Retry(
             total=retry_attempts,
             backoff_factor=1.0,  # More aggressive backoff
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
+            allowed_methods=["GET", "POST"],
+            respect_retry_after_header=True,  # Rate-limited (429) responses wait as long as the API asks
+            backoff_max=30,
+            raise_on_status=False  # Hand the last failed response to _make_request instead of raising RetryError
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Every request goes to api.wto.org, so one pool of MAX_CONNECTIONS kept-alive
+        # connections serves them all; extra threads wait for a free one
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=1,
+            pool_maxsize=self.MAX_CONNECTIONS,
+            pool_block=True
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
+        # Set the API key once instead of building headers for every request
+        if self.api_key:
+            session.headers['Ocp-Apim-Subscription-Key'] = self.api_key
+        
         return session
     
     def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -110,65 +196,68 @@ class WTOTimeseriesAPI:
         """
         url = f"{self.BASE_URL}/{endpoint}"
         params = params or {}
-        headers = {}
-        
-        # Add API key to headers if available
-        if self.api_key:
-            headers['Ocp-Apim-Subscription-Key'] = self.api_key
         
-        # Create cache key based on url and params
-        cache_key = f"{url}:{json.dumps(params, sort_keys=True)}"
+        # Create cache key based on url and params (bytes hash natively as dict keys)
+        cache_key = url.encode() + b"?" + orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
         
         # Return cached result if available
-        if cache_key in self._cache:
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+        if cached is not None:
             logger.debug(f"Using cached result for {url}")
-            return self._cache[cache_key]
+            return cached
         
         try:
             logger.info(f"Making request to {url} with params: {params}")
             response = self.session.get(
                 url, 
                 params=params, 
-                headers=headers,
                 timeout=self.timeout
             )
             
-            # Log response metadata
-            logger.debug(f"Response status: {response.status_code}, content-type: {response.headers.get('content-type')}")
+            # Log response metadata, without building the message otherwise
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Response status: {response.status_code}, content-type: {response.headers.get('content-type')}, "
+                             f"content-encoding: {response.headers.get('content-encoding')}, "
+                             f"{response.headers.get('content-length')} bytes on the wire, {len(response.content)} decoded")
             
             # Handle response based on status code
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    # orjson parses the raw bytes directly, skipping the str decode
+                    data = orjson.loads(response.content)
+                    
+                    if isinstance(data, dict) and 'errors' in data:
+                        logger.error(f"API returned error response: {data['errors']}")
+                        raise Exception(f"API error: {data['errors']}")
                     
-                    # Log response structure for debugging
-                    if isinstance(data, dict):
-                        logger.debug(f"Response is a dictionary with keys: {list(data.keys())}")
-                        if 'errors' in data:
-                            logger.error(f"API returned error response: {data['errors']}")
-                            raise Exception(f"API error: {data['errors']}")
-                    elif isinstance(data, list):
-                        logger.debug(f"Response is a list with {len(data)} items")
-                        if len(data) > 0:
-                            logger.debug(f"First item type: {type(data[0])}")
-                            if isinstance(data[0], dict):
-                                logger.debug(f"Sample first item keys: {list(data[0].keys())[:5]}")
-                    else:
-                        logger.debug(f"Response is of type: {type(data)}")
+                    # Log response structure for debugging, without building the messages otherwise
+                    if logger.isEnabledFor(logging.DEBUG):
+                        if isinstance(data, dict):
+                            logger.debug(f"Response is a dictionary with keys: {list(data.keys())}")
+                        elif isinstance(data, list):
+                            logger.debug(f"Response is a list with {len(data)} items")
+                            if len(data) > 0:
+                                logger.debug(f"First item type: {type(data[0])}")
+                                if isinstance(data[0], dict):
+                                    logger.debug(f"Sample first item keys: {list(data[0].keys())[:5]}")
+                        else:
+                            logger.debug(f"Response is of type: {type(data)}")
                         
                     # Cache successful responses
-                    self._cache[cache_key] = data
+                    with self._cache_lock:
+                        self._cache[cache_key] = data
                     return data
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.error(f"Failed to decode JSON response. Raw content (first 500 chars): {response.text[:500]}")
                     raise Exception("Invalid JSON response from API")
             elif response.status_code == 401:
                 logger.error("Authentication failed - invalid or missing API key")
                 raise Exception(f"API authentication failed: {response.text}. Please check your WTO API subscription key.")
             elif response.status_code == 429:
-                logger.warning("Rate limit exceeded. Waiting before retry.")
-                time.sleep(10)  # Wait before retrying
-                return self._make_request(endpoint, params)  # Retry recursively
+                # The session's Retry adapter has already waited and retried
+                logger.error("Rate limit exceeded after retries")
+                raise Exception(f"API rate limit exceeded: {response.text[:500]}")
             else:
                 logger.error(f"API request failed: {response.status_code} - {response.text[:500]}")
                 raise Exception(f"API request failed: {response.status_code} - {response.text[:500]}")
@@ -245,27 +334,44 @@ class WTOTimeseriesAPI:
         
         return response
     
-    def get_tariff_indicators(self) -> List[Dict[str, Any]]:
+    def get_tariff_indicators(self, all_indicators: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Get tariff-related indicators from the WTO API.
         
+        The indicator catalogue is fetched once and searched by name locally,
+        rather than asking the API once per keyword.
+        
+        Args:
+            all_indicators: Full indicator list, if the caller already fetched it
+            
         Returns:
             List of indicator objects related to tariffs
         """
+        if all_indicators is None:
+            all_indicators = self.get_indicators()
+        
+        def matching(keyword):
+            keyword = keyword.lower()
+            return [ind for ind in all_indicators
+                    if isinstance(ind, dict) and keyword in (ind.get('name') or '').lower()]
+        
         # We first try searching for 'tariff' in indicator names
-        indicators = self.get_indicators(name_filter='tariff')
+        indicators = matching('tariff')
         
         # If we don't find many indicators, try additional keywords
         if len(indicators) < 5:
             logger.info("Few tariff indicators found, trying additional keywords...")
             
             # Try additional keywords that might be related to tariffs
+            seen_codes = {ind.get('code') for ind in indicators}
             for keyword in ['MFN', 'duty', 'applied rate', 'bound rate']:
-                additional = self.get_indicators(name_filter=keyword)
+                additional = matching(keyword)
                 # Add new indicators not already in our list
                 for ind in additional:
-                    if not any(existing.get('code') == ind.get('code') for existing in indicators):
+                    code = ind.get('code')
+                    if code not in seen_codes:
                         indicators.append(ind)
+                        seen_codes.add(code)
             
             logger.info(f"Found total of {len(indicators)} indicators after expansion")
         
@@ -417,23 +523,26 @@ class WTOTimeseriesAPI:
         all_data = []
         
         # Process countries in batches to avoid timeouts
-        for i in range(0, len(reporter_codes), self.batch_size):
-            batch = reporter_codes[i:i+self.batch_size]
-            logger.info(f"Processing batch {i//self.batch_size + 1} with {len(batch)} countries")
-            
-            # Fetch data for this batch
-            batch_data = self.get_tariff_data_batch(indicator_code, batch, years, product_codes)
-            
+        batches = [reporter_codes[i:i+self.batch_size] for i in range(0, len(reporter_codes), self.batch_size)]
+        if not batches:
+            return all_data
+        
+        def fetch_batch(numbered_batch):
+            number, batch = numbered_batch
+            logger.info(f"Processing batch {number} with {len(batch)} countries")
+            return self.get_tariff_data_batch(indicator_code, batch, years, product_codes)
+        
+        # Fetch a few batches at a time on the shared session, keeping batch order;
+        # rate-limited (429) responses are retried with backoff by the session
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(batches))) as executor:
+            batch_results = list(executor.map(fetch_batch, enumerate(batches, start=1)))
+        
+        for batch, batch_data in zip(batches, batch_results):
             if batch_data:
                 all_data.extend(batch_data)
                 logger.info(f"Added {len(batch_data)} data points from batch")
             else:
                 logger.warning(f"No data retrieved for batch with countries: {batch}")
-            
-            # Add a delay between batches to avoid rate limiting
-            if i + self.batch_size < len(reporter_codes):
-                logger.debug("Sleeping between batches")
-                time.sleep(2)
         
         logger.info(f"Total data points collected: {len(all_data)}")
         return all_data
@@ -530,81 +639,51 @@ class WTOTimeseriesAPI:
         
         # Print sample data structure for debugging
         if len(data_points) > 0 and isinstance(data_points[0], dict):
-            logger.info(f"Sample data point structure: {json.dumps(data_points[0], indent=2)}")
+            logger.info(f"Sample data point structure: {orjson.dumps(data_points[0], option=orjson.OPT_INDENT_2).decode()}")
             logger.info(f"Sample data point keys: {list(data_points[0].keys())}")
         
-        # Create a list to hold the transformed data
-        transformed_data = []
-        
-        # WTO API field mapping - corrected based on actual API response
-        field_mappings = {
-            # Capital case field names from actual API response
-            'IndicatorCode': 'indicator_code',
-            'Indicator': 'indicator_name',
-            'ReportingEconomyCode': 'country_code',
-            'ReportingEconomy': 'country_name',
-            'PartnerEconomyCode': 'partner_code',
-            'PartnerEconomy': 'partner_name',
-            'ProductOrSectorCode': 'product_code',
-            'ProductOrSector': 'product_name',
-            'Year': 'year',
-            'Period': 'period', 
-            'Frequency': 'frequency',
-            'Unit': 'unit',
-            'Value': 'value',
-            'ValueFlagCode': 'flag',
-            
-            # Original camelCase field names kept as backup
-            'indicatorCode': 'indicator_code',
-            'indicator': 'indicator_name',
-            'reportingEconomyCode': 'country_code',
-            'reportingEconomy': 'country_name',
-            'partnerEconomyCode': 'partner_code',
-            'partnerEconomy': 'partner_name',
-            'productOrSectorCode': 'product_code',
-            'productOrSector': 'product_name',
-            'year': 'year',
-            'period': 'period', 
-            'frequency': 'frequency',
-            'unit': 'unit',
-            'value': 'value',
-            'valueFlagCode': 'flag'
-        }
-        
-        count_transformed = 0
-        for point in data_points:
-            # Skip non-dictionary data points
-            if not isinstance(point, dict):
-                logger.warning(f"Skipping non-dictionary data point: {point}")
-                continue
-                
-            # Extract relevant fields using mapping
-            transformed_point = {}
-            for api_field, our_field in field_mappings.items():
-                if api_field in point:
-                    transformed_point[our_field] = point.get(api_field)
-            
-            # Add unit and value mapping
-            if 'UnitCode' in point:
-                transformed_point['unit'] = point.get('Unit')
-            
-            # Only add points that have at least some key fields
-            if transformed_point and ('country_code' in transformed_point or 'indicator_code' in transformed_point):
-                transformed_data.append(transformed_point)
-                count_transformed += 1
-            else:
-                logger.debug(f"Skipping point with insufficient data: {point}")
+        # Skip non-dictionary data points
+        records = [point for point in data_points if isinstance(point, dict)]
+        if len(records) < len(data_points):
+            logger.warning(f"Skipping {len(data_points) - len(records)} non-dictionary data points")
+        
+        # Build all columns at once; each of our fields comes from whichever API
+        # spelling is present, the camelCase one winning where a response has both
+        raw = pd.DataFrame.from_records(records)
+        columns = {}
+        for api_field, our_field in self.FIELD_MAPPINGS:
+            if api_field in raw.columns:
+                column = raw[api_field]
+                columns[our_field] = column.combine_first(columns[our_field]) if our_field in columns else column
+        df = pd.DataFrame(columns)
+        
+        # Only keep points that have at least some key fields
+        key_fields = [field for field in ('country_code', 'indicator_code') if field in df.columns]
+        if key_fields:
+            df = df[df[key_fields].notna().any(axis=1)].reset_index(drop=True)
+        else:
+            df = pd.DataFrame()
         
         # Log how many points were transformed
-        logger.info(f"Successfully transformed {count_transformed} data points out of {len(data_points)}")
+        logger.info(f"Successfully transformed {len(df)} data points out of {len(data_points)}")
         
-        # Check if we have any data to create DataFrame
-        if not transformed_data:
+        # Check if we have any data
+        if df.empty:
             logger.warning("No data points were successfully transformed")
             return pd.DataFrame()
-            
-        # Convert to DataFrame
-        df = pd.DataFrame(transformed_data)
+        
+        # Codes, names and units repeat for every year and partner of an economy
+        category_columns = [
+            column for column in ("indicator_code", "indicator_name", "country_code", "country_name",
+                                  "partner_code", "partner_name", "product_code", "product_name",
+                                  "period", "frequency", "unit", "flag")
+            if column in df.columns
+        ]
+        df[category_columns] = df[category_columns].astype("category")
+        
+        # Years are small integers, so don't hold them as int64
+        for column in df.select_dtypes("int64").columns:
+            df[column] = pd.to_numeric(df[column], downcast="integer")
         
         # Log column info
         logger.debug(f"DataFrame columns: {list(df.columns)}")
@@ -631,8 +710,38 @@ class WTOTimeseriesAPI:
         full_filename = f"{filename}_{timestamp}.csv"
         filepath = os.path.join(self.output_dir, full_filename)
         
-        # Save to CSV
-        df.to_csv(filepath, index=False)
+        # Save to CSV, letting Arrow serialize the columns in C. Arrow's dialect is not
+        # df.to_csv's: the header and every string field are quoted, whole floats are
+        # written without a decimal point (2, not 2.0) and booleans as true/false
+        try:
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), filepath)
+        except pa.ArrowException as e:
+            # Mixed-type object columns cannot be converted to Arrow
+            logger.debug(f"Falling back to pandas CSV writer: {str(e)}")
+            df.to_csv(filepath, index=False)
+        logger.info(f"Data saved to {filepath}")
+        
+        return filepath
+    
+    def save_to_parquet(self, df: pd.DataFrame, filename: str) -> str:
+        """
+        Save DataFrame to a zstd-compressed Parquet file.
+        
+        Args:
+            df: Pandas DataFrame to save
+            filename: Base filename (without extension)
+            
+        Returns:
+            Path to the saved file
+        """
+        # Add timestamp and extension
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        full_filename = f"{filename}_{timestamp}.parquet"
+        filepath = os.path.join(self.output_dir, full_filename)
+        
+        # Save to Parquet
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, filepath, compression="zstd")
         logger.info(f"Data saved to {filepath}")
         
         return filepath
@@ -653,12 +762,12 @@ class WTOTimeseriesAPI:
         full_filename = f"{filename}_{timestamp}.json"
         filepath = os.path.join(self.output_dir, full_filename)
         
-        # Save to JSON
-        with open(filepath, 'w') as f:
-            if isinstance(data, pd.DataFrame):
-                f.write(data.to_json(orient='records', date_format='iso'))
-            else:
-                json.dump(data, f, indent=2)
+        # Save to JSON; pandas' C writer handles frames, orjson everything else
+        if isinstance(data, pd.DataFrame):
+            data.to_json(filepath, orient='records', date_format='iso')
+        else:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Data saved to {filepath}")
         
@@ -683,8 +792,9 @@ class WTOTimeseriesAPI:
             logger.warning("No valid countries provided to fetch_country_tariff_profiles")
             return pd.DataFrame()  # Return empty DataFrame
             
-        # Get available tariff indicators first
-        tariff_indicators = self.get_tariff_indicators()
+        # Get the indicator catalogue once; tariff and trade indicators are both picked from it
+        all_indicators = self.get_indicators()
+        tariff_indicators = self.get_tariff_indicators(all_indicators)
         
         # From the log, we can see several MFN-related indicators
         # Let's select an appropriate one for each data type we need
@@ -740,7 +850,6 @@ class WTOTimeseriesAPI:
         # Since none are visible in the tariff indicators, let's search all indicators
         
         logger.info("Searching for trade balance indicators...")
-        all_indicators = self.get_indicators()
         
         trade_balance_indicator = None
         for ind in all_indicators:
@@ -777,10 +886,17 @@ class WTOTimeseriesAPI:
         df_tariffs = None
         df_trade = None
         
-        # Fetch tariff data
-        logger.info(f"Fetching tariff data with indicator {mfn_indicator}")
+        # The tariff and trade series are independent, so fetch them at the same time
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            logger.info(f"Fetching tariff data with indicator {mfn_indicator}")
+            tariff_future = executor.submit(self.get_tariff_data, mfn_indicator, countries, years)
+            if trade_balance_indicator:
+                logger.info(f"Fetching trade data with indicator {trade_balance_indicator}")
+                trade_future = executor.submit(self.get_tariff_data, trade_balance_indicator, countries, years)
+        
+        # Transform tariff data
         try:
-            tariff_data = self.get_tariff_data(mfn_indicator, countries, years)
+            tariff_data = tariff_future.result()
             df_tariffs = self.transform_to_dataframe(tariff_data)
             
             # Log sample of data for debugging
@@ -792,11 +908,10 @@ class WTOTimeseriesAPI:
             logger.error(f"Error fetching tariff data: {str(e)}")
             return pd.DataFrame()  # Return empty DataFrame if we can't get tariff data
         
-        # Fetch trade balance data if we found an indicator
+        # Transform trade balance data if we found an indicator
         if trade_balance_indicator:
-            logger.info(f"Fetching trade data with indicator {trade_balance_indicator}")
             try:
-                trade_data = self.get_tariff_data(trade_balance_indicator, countries, years)
+                trade_data = trade_future.result()
                 df_trade = self.transform_to_dataframe(trade_data)
                 
                 # Log sample of data for debugging
@@ -934,7 +1049,7 @@ class WTOTimeseriesAPI:
             
             # 2. Fetch tariff-related indicators
             logger.info("Fetching tariff-related indicators...")
-            tariff_indicators = self.get_tariff_indicators()
+            tariff_indicators = self.get_tariff_indicators(all_indicators)
             indicator_file = self.save_to_json(tariff_indicators, "tariff_indicators")
             result["files"]["indicators"] = indicator_file
             result["summary"]["indicator_count"] = len(tariff_indicators)
@@ -997,6 +1112,12 @@ class WTOTimeseriesAPI:
                 
                 result["files"]["tariff_profiles_csv"] = csv_file
                 result["files"]["tariff_profiles_json"] = json_file
+                
+                # Columnar copy for downstream analytics
+                try:
+                    result["files"]["tariff_profiles_parquet"] = self.save_to_parquet(profiles, "tariff_profiles")
+                except pa.ArrowException as e:
+                    logger.warning(f"Could not convert tariff profiles to Arrow, skipping Parquet output: {str(e)}")
                 result["summary"]["data_points"] = len(profiles)
                 
                 # 5. Save a "latest" version for dashboard use
@@ -1090,6 +1211,13 @@ def parse_arguments():
         help="Number of countries to process in a single request (default: 5)"
     )
     
+    parser.add_argument(
+        "--concurrency", 
+        type=int,
+        default=4,
+        help="Number of country batches requested at the same time (default: 4)"
+    )
+    
     parser.add_argument(
         "--log-level", 
         default="INFO",
@@ -1131,7 +1259,8 @@ def main():
             retry_attempts=args.retries,
             timeout=args.timeout,
             output_dir=args.output_dir,
-            batch_size=args.batch_size
+            batch_size=args.batch_size,
+            concurrency=args.concurrency
         )
         
         # Run the extraction